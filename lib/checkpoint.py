@@ -0,0 +1,113 @@
+import struct
+
+# magic, version, generation, difficulty index, level, seed, baseline x/y/z
+_FORMAT = "<2sBIBBI3f"
+_MAGIC = b"MW"
+_VERSION = 1
+_PAYLOAD_SIZE = struct.calcsize(_FORMAT)
+_SLOT_SIZE = _PAYLOAD_SIZE + 2  # + CRC-16
+
+DIFFICULTIES = ("EASY", "MEDIUM", "HARD")
+
+
+def crc16(data, crc=0xFFFF):
+    """CRC-16/CCITT-FALSE."""
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+        crc &= 0xFFFF
+    return crc
+
+
+class Checkpoint:
+    """Game progress at a level boundary."""
+
+    def __init__(self, difficulty, level, seed, baseline, generation=0):
+        self.difficulty = difficulty
+        self.level = level
+        self.seed = seed
+        self.baseline = baseline
+        self.generation = generation
+
+    def __repr__(self):
+        return (f"Checkpoint({self.difficulty} L{self.level}, seed={self.seed}, "
+                f"gen={self.generation})")
+
+
+class CheckpointStore:
+    """
+    CheckpointStore(nvm, offset=0)
+
+    Keeps the latest Checkpoint in non-volatile memory (e.g. microcontroller.nvm).
+
+    Two slots are written alternately, each with a generation counter and a
+    CRC. A write torn by a brown-out leaves a slot with a bad CRC; load()
+    then falls back to the other slot, i.e. the previous level boundary.
+    Clearing writes a newer record with level 0 ("no game in progress").
+    """
+
+    def __init__(self, nvm, offset=0):
+        self._nvm = nvm
+        self._offset = offset
+        self._buf = bytearray(_SLOT_SIZE)
+        self.generation = 0
+        self._latest_slot = 1
+        self._scan()
+
+    def _read_slot(self, slot):
+        start = self._offset + slot * _SLOT_SIZE
+        data = bytes(self._nvm[start:start + _SLOT_SIZE])
+        if len(data) < _SLOT_SIZE:
+            return None
+        crc = data[_PAYLOAD_SIZE] | data[_PAYLOAD_SIZE + 1] << 8
+        if crc16(data[:_PAYLOAD_SIZE]) != crc:
+            return None
+        magic, version, generation, diff_index, level, seed, bx, by, bz = \
+            struct.unpack_from(_FORMAT, data)
+        if magic != _MAGIC or version != _VERSION or diff_index >= len(DIFFICULTIES):
+            return None
+        return Checkpoint(DIFFICULTIES[diff_index], level, seed, (bx, by, bz), generation)
+
+    def _scan(self):
+        """Find the newest valid slot; remember its generation."""
+        self._latest = None
+        for slot in (0, 1):
+            record = self._read_slot(slot)
+            if record is None:
+                continue
+            if self._latest is None or record.generation > self._latest.generation:
+                self._latest = record
+                self._latest_slot = slot
+        if self._latest is not None:
+            self.generation = self._latest.generation
+
+    def load(self):
+        """Return the latest Checkpoint of a game in progress, or None."""
+        if self._latest is None or self._latest.level == 0:
+            return None
+        return self._latest
+
+    def save(self, difficulty, level, seed, baseline):
+        """Write a checkpoint to the older slot; return its generation."""
+        self.generation += 1
+        bx, by, bz = baseline
+        struct.pack_into(_FORMAT, self._buf, 0, _MAGIC, _VERSION, self.generation,
+                         DIFFICULTIES.index(difficulty) if level else 0, level,
+                         seed & 0xFFFFFFFF, bx, by, bz)
+        crc = crc16(memoryview(self._buf)[:_PAYLOAD_SIZE])
+        self._buf[_PAYLOAD_SIZE] = crc & 0xFF
+        self._buf[_PAYLOAD_SIZE + 1] = crc >> 8
+
+        slot = 1 - self._latest_slot
+        start = self._offset + slot * _SLOT_SIZE
+        self._nvm[start:start + _SLOT_SIZE] = self._buf
+        self._latest_slot = slot
+        self._latest = Checkpoint(difficulty, level, seed & 0xFFFFFFFF, (bx, by, bz),
+                                  self.generation)
+        return self.generation
+
+    def clear(self):
+        """Mark that no game is in progress (only writes if one was saved)."""
+        if self.load() is not None:
+            self.save(DIFFICULTIES[0], 0, 0, (0.0, 0.0, 0.0))
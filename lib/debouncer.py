@@ -0,0 +1,50 @@
+from ticks import ticks_ms, ticks_diff
+
+
+class Debouncer:
+    """
+    Debouncer(pin_in, *, debounce_ms=50)
+
+    Timer-based debounce for an active-low push button.
+
+    - pin_in: object with a boolean .value (e.g. digitalio.DigitalInOut)
+    - debounce_ms: time (ms) the raw state must stay unchanged to be accepted
+    """
+
+    def __init__(self, pin_in, *, debounce_ms=50):
+        self._pin = pin_in
+        self._debounce_ms = int(debounce_ms)
+
+        self._last_state = pin_in.value     # immediate raw reading from last loop
+        self._stable_state = self._last_state  # debounced (accepted) state
+        self._last_time = ticks_ms()
+
+    @property
+    def value(self):
+        """Debounced state (False while pressed)."""
+        return self._stable_state
+
+    def fell(self):
+        """
+        Return True exactly once when the button is PRESSED (debounced falling edge).
+        """
+        current_state = self._pin.value
+        now = ticks_ms()
+
+        # If raw state changed, mark the time of this potential transition
+        if current_state != self._last_state:
+            self._last_time = now
+            self._last_state = current_state
+
+        # If the raw state has stayed unchanged longer than debounce_ms,
+        # accept it as the new stable state and trigger events accordingly.
+        if ticks_diff(now, self._last_time) > self._debounce_ms:
+            if self._stable_state != current_state:
+                # We have a debounced state change
+                self._stable_state = current_state
+
+                if not self._stable_state:
+                    # stable_state == False means button is PRESSED (fell edge)
+                    return True
+
+        return False
@@ -0,0 +1,102 @@
+from ticks import ticks_ms, ticks_diff
+
+
+class IdleManager:
+    """
+    IdleManager(*, slow_after_ms=15000, display_off_after_ms=60000, sleep_after_ms=180000,
+                slow_poll_s=0.02, display_off_poll_s=0.02, on_state_change=None, sleep_fn=None)
+
+    Steps the device down through power states while nobody touches it:
+    ACTIVE -> SLOW_POLL -> DISPLAY_OFF -> SLEEP.
+
+    - *_after_ms: inactivity (ms) before entering each state; None skips that state
+    - slow_poll_s, display_off_poll_s: loop delay returned by step() in those states.
+      Keep them at or below half the button debounce time: a press has to
+      span two polls to be seen, so longer delays drop short taps.
+    - on_state_change(old, new): called on every state change (turn display off/on, ...)
+    - sleep_fn(): blocks in low-power sleep until a wake alarm; the manager is
+      ACTIVE again when it returns, unless it returns False (woken by a timer
+      only): then it stays in SLEEP and sleeps again on the next step()
+
+    Time in each state is added up on every step(). ticks_diff() is only valid
+    up to 2**28 ms (~3.1 days), so sleep_fn() should also wake on a timer well
+    within that (e.g. hourly) and return False.
+
+    Call step(active) once per input loop, with active=True when there was
+    user input, and sleep for the returned number of seconds.
+    """
+
+    ACTIVE = 0
+    SLOW_POLL = 1
+    DISPLAY_OFF = 2
+    SLEEP = 3
+    STATE_NAMES = ("ACTIVE", "SLOW_POLL", "DISPLAY_OFF", "SLEEP")
+
+    def __init__(self, *, slow_after_ms=15000, display_off_after_ms=60000, sleep_after_ms=180000,
+                 slow_poll_s=0.02, display_off_poll_s=0.02, on_state_change=None, sleep_fn=None):
+        self._after_ms = (0, slow_after_ms, display_off_after_ms, sleep_after_ms)
+        self._poll_s = (None, slow_poll_s, display_off_poll_s, None)
+        self._on_state_change = on_state_change
+        self._sleep_fn = sleep_fn
+
+        now = ticks_ms()
+        self.state = self.ACTIVE
+        self._state_since = now
+        self._last_activity = now
+        self._time_in_state = [0, 0, 0, 0]
+
+    def activity(self):
+        """Record user input now; wakes the device if it was stepped down."""
+        self._last_activity = ticks_ms()
+        if self.state != self.ACTIVE:
+            self._set_state(self.ACTIVE)
+
+    def step(self, active=False, poll_s=0.01):
+        """
+        Update the power state and return how long (s) to sleep before polling again.
+        poll_s is the delay used while ACTIVE.
+        """
+        self._add_time()
+        if active:
+            self.activity()
+            return poll_s
+
+        idle_ms = ticks_diff(ticks_ms(), self._last_activity)
+        target = self.ACTIVE
+        for state in (self.SLOW_POLL, self.DISPLAY_OFF, self.SLEEP):
+            after_ms = self._after_ms[state]
+            if after_ms is not None and idle_ms >= after_ms:
+                target = state
+        if target == self.SLEEP and self._sleep_fn is None:
+            target = self.DISPLAY_OFF
+
+        if target > self.state:
+            self._set_state(target)
+        if self.state == self.SLEEP:
+            # Blocks until a wake alarm fires
+            if self._sleep_fn() is False:
+                self._add_time()
+            else:
+                self.activity()
+
+        delay = self._poll_s[self.state]
+        return poll_s if delay is None else max(poll_s, delay)
+
+    def _add_time(self):
+        """Add the time since the last call to the current state's total."""
+        now = ticks_ms()
+        self._time_in_state[self.state] += ticks_diff(now, self._state_since)
+        self._state_since = now
+
+    def _set_state(self, new):
+        self._add_time()
+        old = self.state
+        self.state = new
+        if self._on_state_change:
+            self._on_state_change(old, new)
+
+    def time_in_state_ms(self):
+        """Return {state name: total ms spent in it}, including the current state."""
+        totals = list(self._time_in_state)
+        totals[self.state] += ticks_diff(ticks_ms(), self._state_since)
+        return dict(zip(self.STATE_NAMES, totals))
@@ -0,0 +1,123 @@
+COMMANDS = ("FORWARD", "BACKWARD", "LEFT", "RIGHT")
+# codes are indexes into COMMANDS; code ^ 1 is the opposite direction
+
+
+class XorShift32:
+    """
+    XorShift32(seed)
+
+    Small PRNG that gives the same numbers on CircuitPython and CPython
+    (the built-in random modules differ), so a seed replays everywhere.
+    """
+
+    def __init__(self, seed):
+        self.state = (seed & 0xFFFFFFFF) or 0x9E3779B9  # 0 is a fixed point
+        for _ in range(8):  # spread small seeds
+            self.next()
+
+    def next(self):
+        x = self.state
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.state = x
+        return x
+
+    def below(self, n):
+        return self.next() % n
+
+
+class LevelPlan:
+    """
+    LevelPlan(seed, *, levels=10, max_run=2, balanced=True, min_reversals=1, max_tries=1000)
+
+    Commands of every level of one game, generated once from seed and packed
+    four 2-bit codes per byte in .data (75 commands -> 19 bytes). Level n has
+    n + 2 commands. Each level is shuffled until it meets the constraints:
+    - max_run: no direction more than max_run times in a row (None: no limit)
+    - balanced: direction counts in a level differ by at most one
+    - min_reversals: at least this many direct reversals (e.g. LEFT, RIGHT),
+      capped at length - 1
+    Raises ValueError if a level needs more than max_tries shuffles, e.g.
+    when the constraints cannot be met by a short level.
+    """
+
+    def __init__(self, seed, *, levels=10, max_run=2, balanced=True, min_reversals=1,
+                 max_tries=1000):
+        self.seed = seed & 0xFFFFFFFF
+        self.levels = levels
+        self.max_run = max_run
+        self.balanced = balanced
+        self.min_reversals = min_reversals
+        total = self.level_offset(levels + 1)
+        self.data = bytearray((total + 3) // 4)
+
+        rng = XorShift32(self.seed)
+        for level in range(1, levels + 1):
+            codes = self._generate_level(rng, self.level_length(level), max_tries)
+            offset = self.level_offset(level)
+            for i, code in enumerate(codes):
+                self._set(offset + i, code)
+
+    @staticmethod
+    def level_length(level):
+        return level + 2
+
+    @staticmethod
+    def level_offset(level):
+        """Index of the first command of level in the packed plan."""
+        # sum of (l + 2) for l in 1..level-1
+        return (level - 1) * (level + 4) // 2
+
+    def _set(self, index, code):
+        shift = (index & 3) * 2
+        byte = index >> 2
+        self.data[byte] = (self.data[byte] & ~(3 << shift)) | (code << shift)
+
+    def _get(self, index):
+        return (self.data[index >> 2] >> ((index & 3) * 2)) & 3
+
+    def _generate_level(self, rng, length, max_tries):
+        if self.balanced:
+            # every direction length // 4 times, the rest on distinct directions
+            codes = [i % 4 for i in range(length - length % 4)]
+            extra = [0, 1, 2, 3]
+            for i in range(length % 4):
+                j = i + rng.below(4 - i)
+                extra[i], extra[j] = extra[j], extra[i]
+                codes.append(extra[i])
+
+        for _ in range(max_tries):
+            if self.balanced:
+                # Fisher-Yates shuffle
+                for i in range(length - 1, 0, -1):
+                    j = rng.below(i + 1)
+                    codes[i], codes[j] = codes[j], codes[i]
+            else:
+                codes = [rng.below(4) for _ in range(length)]
+            if self.satisfied(codes):
+                return codes
+        raise ValueError(f"no level of length {length} meets the plan constraints")
+
+    def satisfied(self, codes):
+        """True if a level's codes meet max_run and min_reversals."""
+        run = 1
+        reversals = 0
+        for i in range(1, len(codes)):
+            if codes[i] == codes[i - 1]:
+                run += 1
+                if self.max_run is not None and run > self.max_run:
+                    return False
+            else:
+                run = 1
+                if codes[i] == codes[i - 1] ^ 1:
+                    reversals += 1
+        return reversals >= min(self.min_reversals, len(codes) - 1)
+
+    def codes(self, level):
+        offset = self.level_offset(level)
+        return [self._get(offset + i) for i in range(self.level_length(level))]
+
+    def commands(self, level):
+        """Command names of level (1-based), e.g. ["LEFT", "RIGHT", "FORWARD"]."""
+        return [COMMANDS[code] for code in self.codes(level)]
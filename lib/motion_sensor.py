@@ -0,0 +1,441 @@
+"""
+Motion sensor backends with raw integer reads.
+
+Every backend returns raw signed counts; multiply by .scale to get m/s^2.
+Game logic converts its thresholds to counts once, so there is no
+per-sample float conversion.
+
+- ADXL345Sensor: the ADXL345 accelerometer (up to 3200 Hz)
+- LSM6DSOXSensor: LSM6DSOX IMU on the same I2C bus (up to 6660 Hz)
+- TraceSensor: replays a recorded trace file
+"""
+import struct
+from array import array
+
+from adafruit_bus_device.i2c_device import I2CDevice
+
+STANDARD_GRAVITY = 9.80665  # m/s^2
+
+
+class MotionSensor:
+    """
+    Base class of the motion sensor backends.
+
+    - scale: m/s^2 per raw count
+    - range_g: full-scale range in g
+    - full_resolution: True when resolution does not drop as the range grows
+    - data_rate: output data rate in Hz
+    - bandwidth: low-pass bandwidth in Hz
+    """
+
+    scale = 1.0
+    range_g = None
+    full_resolution = True
+    data_rate = None
+    bandwidth = None
+
+    def read_raw(self):
+        """Return one (x, y, z) sample in raw counts."""
+        raise NotImplementedError
+
+    def read_batch(self, buf):
+        """
+        Read buffered samples into buf, an array("h") of x, y, z triplets.
+        Return the number of samples stored (at most len(buf) // 3).
+        Backends without a FIFO store the current sample only.
+        """
+        if len(buf) < 3:
+            return 0
+        buf[0], buf[1], buf[2] = self.read_raw()
+        return 1
+
+    @property
+    def acceleration(self):
+        """One (x, y, z) sample in m/s^2 (for debugging, not the hot path)."""
+        x, y, z = self.read_raw()
+        return x * self.scale, y * self.scale, z * self.scale
+
+    def enable_activity_interrupt(self, threshold=18):
+        """Raise the sensor's interrupt pin on motion, if supported."""
+
+    def activity(self):
+        """Return (and clear) the activity interrupt state."""
+        return False
+
+
+class _I2CRegisters:
+    """Register access helpers shared by the I2C backends."""
+
+    def _init_device(self, i2c, address):
+        self._device = I2CDevice(i2c, address)
+        self._cmd = bytearray(1)
+        self._pair = bytearray(2)
+        self._one = bytearray(1)
+
+    def _read_into(self, register, buf):
+        self._cmd[0] = register
+        with self._device as device:
+            device.write_then_readinto(self._cmd, buf)
+
+    def _read_u8(self, register):
+        self._read_into(register, self._one)
+        return self._one[0]
+
+    def _write_u8(self, register, value):
+        self._pair[0] = register
+        self._pair[1] = value & 0xFF
+        with self._device as device:
+            device.write(self._pair)
+
+
+# ========= ADXL345 =========
+_ADXL345_DEVID = 0xE5
+_ADXL345_REG_DEVID = 0x00
+_ADXL345_REG_THRESH_ACT = 0x24
+_ADXL345_REG_ACT_INACT_CTL = 0x27
+_ADXL345_REG_BW_RATE = 0x2C
+_ADXL345_REG_POWER_CTL = 0x2D
+_ADXL345_REG_INT_ENABLE = 0x2E
+_ADXL345_REG_INT_MAP = 0x2F
+_ADXL345_REG_INT_SOURCE = 0x30
+_ADXL345_REG_DATA_FORMAT = 0x31
+_ADXL345_REG_DATAX0 = 0x32
+_ADXL345_REG_FIFO_CTL = 0x38
+_ADXL345_REG_FIFO_STATUS = 0x39
+_ADXL345_INT_ACTIVITY = 0x10
+_ADXL345_MEASURE = 0x08
+_ADXL345_FULL_RES = 0x08
+_ADXL345_FIFO_STREAM = 0x80
+_ADXL345_MG_PER_LSB = 0.004  # full resolution / 10-bit at +-2 g
+
+
+class ADXL345Sensor(_I2CRegisters, MotionSensor):
+    """
+    ADXL345Sensor(i2c, address=0x53, *, range_g=2, full_resolution=True, data_rate=100, fifo=False)
+
+    - range_g: 2, 4, 8 or 16
+    - full_resolution: keep 4 mg/LSB at every range (else 10-bit output)
+    - data_rate: output data rate in Hz, 25 ~ 3200; bandwidth is data_rate / 2
+    - fifo: buffer samples in the 32-entry FIFO (stream mode) for read_batch().
+      With the FIFO on, read_raw() returns the oldest unread sample.
+    """
+
+    DATA_RATES = {3200: 0x0F, 1600: 0x0E, 800: 0x0D, 400: 0x0C,
+                  200: 0x0B, 100: 0x0A, 50: 0x09, 25: 0x08}
+    RANGES = {2: 0x00, 4: 0x01, 8: 0x02, 16: 0x03}
+
+    def __init__(self, i2c, address=0x53, *, range_g=2, full_resolution=True,
+                 data_rate=100, fifo=False):
+        self._init_device(i2c, address)
+        self._sample = bytearray(6)
+        self._fifo_status = bytearray(1)
+        if self._read_u8(_ADXL345_REG_DEVID) != _ADXL345_DEVID:
+            raise RuntimeError("ADXL345 not found")
+
+        self._range_g = range_g
+        self._full_resolution = full_resolution
+        self._write_data_format()
+        self.data_rate = data_rate
+        self.fifo = fifo
+        self._write_u8(_ADXL345_REG_POWER_CTL, _ADXL345_MEASURE)
+
+    def _write_data_format(self):
+        if self._range_g not in self.RANGES:
+            raise ValueError("range_g must be one of 2, 4, 8, 16")
+        value = self.RANGES[self._range_g]
+        if self._full_resolution:
+            value |= _ADXL345_FULL_RES
+        self._write_u8(_ADXL345_REG_DATA_FORMAT, value)
+
+        g_per_lsb = _ADXL345_MG_PER_LSB
+        if not self._full_resolution:
+            g_per_lsb *= self._range_g // 2
+        self.scale = g_per_lsb * STANDARD_GRAVITY
+
+    @property
+    def range_g(self):
+        return self._range_g
+
+    @range_g.setter
+    def range_g(self, value):
+        self._range_g = value
+        self._write_data_format()
+
+    @property
+    def full_resolution(self):
+        return self._full_resolution
+
+    @full_resolution.setter
+    def full_resolution(self, value):
+        self._full_resolution = bool(value)
+        self._write_data_format()
+
+    @property
+    def data_rate(self):
+        return self._data_rate
+
+    @data_rate.setter
+    def data_rate(self, value):
+        if value not in self.DATA_RATES:
+            raise ValueError("unsupported ADXL345 data rate")
+        self._data_rate = value
+        self._write_u8(_ADXL345_REG_BW_RATE, self.DATA_RATES[value])
+
+    @property
+    def bandwidth(self):
+        # The ADXL345 bandwidth is fixed at half the output data rate
+        return self._data_rate / 2
+
+    @bandwidth.setter
+    def bandwidth(self, value):
+        self.data_rate = int(value * 2)
+
+    @property
+    def fifo(self):
+        return self._fifo
+
+    @fifo.setter
+    def fifo(self, value):
+        self._fifo = bool(value)
+        self._write_u8(_ADXL345_REG_FIFO_CTL, (_ADXL345_FIFO_STREAM | 0x1F) if self._fifo else 0x00)
+
+    def read_raw(self):
+        self._read_into(_ADXL345_REG_DATAX0, self._sample)
+        return struct.unpack_from("<hhh", self._sample)
+
+    def read_batch(self, buf):
+        if not self._fifo:
+            return MotionSensor.read_batch(self, buf)
+        self._read_into(_ADXL345_REG_FIFO_STATUS, self._fifo_status)
+        count = min(self._fifo_status[0] & 0x3F, len(buf) // 3)
+        sample = self._sample
+        for i in range(count):
+            # each FIFO entry must be read as one 6-byte burst
+            self._read_into(_ADXL345_REG_DATAX0, sample)
+            j = i * 3
+            buf[j], buf[j + 1], buf[j + 2] = struct.unpack_from("<hhh", sample)
+        return count
+
+    def enable_activity_interrupt(self, threshold=18):
+        """Activity (threshold in 62.5 mg units, x/y/z, AC-coupled) on INT1."""
+        self._write_u8(_ADXL345_REG_THRESH_ACT, threshold)
+        # AC-coupled: the threshold applies to the change from the reading
+        # when activity detection started, so gravity and tilt do not count
+        self._write_u8(_ADXL345_REG_ACT_INACT_CTL, 0b11110000)
+        int_map = self._read_u8(_ADXL345_REG_INT_MAP)
+        self._write_u8(_ADXL345_REG_INT_MAP, int_map & ~_ADXL345_INT_ACTIVITY)
+        int_enable = self._read_u8(_ADXL345_REG_INT_ENABLE)
+        self._write_u8(_ADXL345_REG_INT_ENABLE, int_enable | _ADXL345_INT_ACTIVITY)
+
+    def activity(self):
+        # reading INT_SOURCE clears the latched interrupt
+        return bool(self._read_u8(_ADXL345_REG_INT_SOURCE) & _ADXL345_INT_ACTIVITY)
+
+
+# ========= LSM6DSOX =========
+_LSM6DSOX_CHIP_ID = 0x6C
+_LSM6DS_REG_FIFO_CTRL3 = 0x09
+_LSM6DS_REG_FIFO_CTRL4 = 0x0A
+_LSM6DS_REG_WHO_AM_I = 0x0F
+_LSM6DS_REG_CTRL1_XL = 0x10
+_LSM6DS_REG_CTRL3_C = 0x12
+_LSM6DS_REG_CTRL8_XL = 0x17
+_LSM6DS_REG_OUTX_L_A = 0x28
+_LSM6DS_REG_FIFO_STATUS1 = 0x3A
+_LSM6DS_REG_FIFO_DATA_OUT_TAG = 0x78
+_LSM6DS_BDU_IF_INC = 0x44
+_LSM6DS_LPF2_XL_EN = 0x02
+_LSM6DS_FIFO_CONTINUOUS = 0x06
+_LSM6DS_TAG_ACCEL = 0x02
+
+
+class LSM6DSOXSensor(_I2CRegisters, MotionSensor):
+    """
+    LSM6DSOXSensor(i2c, address=0x6A, *, range_g=2, data_rate=416, bandwidth=None, fifo=False)
+
+    Accelerometer of an LSM6DSOX IMU. Output is always 16-bit.
+
+    - range_g: 2, 4, 8 or 16
+    - data_rate: output data rate in Hz, 26 ~ 6660
+    - bandwidth: low-pass (LPF2) cutoff in Hz, rounded to data_rate / {4, 10, 20,
+      45, 100, 200, 400, 800}; None leaves LPF2 off (about data_rate / 2)
+    - fifo: buffer accelerometer samples in the FIFO (continuous mode) for read_batch()
+    """
+
+    DATA_RATES = {26: 0x2, 52: 0x3, 104: 0x4, 208: 0x5, 416: 0x6,
+                  833: 0x7, 1660: 0x8, 3330: 0x9, 6660: 0xA}
+    RANGES = {2: 0b00, 4: 0b10, 8: 0b11, 16: 0b01}
+    MG_PER_LSB = {2: 0.061, 4: 0.122, 8: 0.244, 16: 0.488}
+    LPF2_DIVIDERS = (4, 10, 20, 45, 100, 200, 400, 800)
+
+    full_resolution = True
+
+    def __init__(self, i2c, address=0x6A, *, range_g=2, data_rate=416, bandwidth=None,
+                 fifo=False):
+        self._init_device(i2c, address)
+        self._sample = bytearray(6)
+        self._entry = bytearray(7)
+        self._status = bytearray(2)
+        if self._read_u8(_LSM6DS_REG_WHO_AM_I) != _LSM6DSOX_CHIP_ID:
+            raise RuntimeError("LSM6DSOX not found")
+
+        self._write_u8(_LSM6DS_REG_CTRL3_C, _LSM6DS_BDU_IF_INC)
+        if range_g not in self.RANGES:
+            raise ValueError("range_g must be one of 2, 4, 8, 16")
+        if data_rate not in self.DATA_RATES:
+            raise ValueError("unsupported LSM6DSOX data rate")
+        self._range_g = range_g
+        self._data_rate = data_rate
+        self._lpf2_divider = None
+        self.bandwidth = bandwidth  # writes CTRL1_XL / CTRL8_XL
+        self.fifo = fifo
+
+    def _write_ctrl(self):
+        ctrl1 = self.DATA_RATES[self._data_rate] << 4 | self.RANGES[self._range_g] << 2
+        if self._lpf2_divider is not None:
+            ctrl1 |= _LSM6DS_LPF2_XL_EN
+            self._write_u8(_LSM6DS_REG_CTRL8_XL,
+                           self.LPF2_DIVIDERS.index(self._lpf2_divider) << 5)
+        self._write_u8(_LSM6DS_REG_CTRL1_XL, ctrl1)
+        self.scale = self.MG_PER_LSB[self._range_g] / 1000.0 * STANDARD_GRAVITY
+
+    @property
+    def range_g(self):
+        return self._range_g
+
+    @range_g.setter
+    def range_g(self, value):
+        if value not in self.RANGES:
+            raise ValueError("range_g must be one of 2, 4, 8, 16")
+        self._range_g = value
+        self._write_ctrl()
+
+    @property
+    def data_rate(self):
+        return self._data_rate
+
+    @data_rate.setter
+    def data_rate(self, value):
+        if value not in self.DATA_RATES:
+            raise ValueError("unsupported LSM6DSOX data rate")
+        self._data_rate = value
+        self._write_ctrl()
+        if getattr(self, "_fifo", False):
+            self.fifo = True  # batch rate follows the data rate
+
+    @property
+    def bandwidth(self):
+        if self._lpf2_divider is None:
+            return self._data_rate / 2
+        return self._data_rate / self._lpf2_divider
+
+    @bandwidth.setter
+    def bandwidth(self, value):
+        if value is None:
+            self._lpf2_divider = None
+        else:
+            wanted = self._data_rate / value
+            self._lpf2_divider = min(self.LPF2_DIVIDERS, key=lambda d: abs(d - wanted))
+        self._write_ctrl()
+
+    @property
+    def fifo(self):
+        return self._fifo
+
+    @fifo.setter
+    def fifo(self, value):
+        self._fifo = bool(value)
+        if self._fifo:
+            self._write_u8(_LSM6DS_REG_FIFO_CTRL3, self.DATA_RATES[self._data_rate])
+            self._write_u8(_LSM6DS_REG_FIFO_CTRL4, _LSM6DS_FIFO_CONTINUOUS)
+        else:
+            self._write_u8(_LSM6DS_REG_FIFO_CTRL4, 0x00)
+
+    def read_raw(self):
+        self._read_into(_LSM6DS_REG_OUTX_L_A, self._sample)
+        return struct.unpack_from("<hhh", self._sample)
+
+    def read_batch(self, buf):
+        if not self._fifo:
+            return MotionSensor.read_batch(self, buf)
+        self._read_into(_LSM6DS_REG_FIFO_STATUS1, self._status)
+        entries = self._status[0] | (self._status[1] & 0x03) << 8
+        capacity = len(buf) // 3
+        entry = self._entry
+        count = 0
+        for _ in range(entries):
+            if count >= capacity:
+                break
+            # tag byte followed by the 6 data bytes
+            self._read_into(_LSM6DS_REG_FIFO_DATA_OUT_TAG, entry)
+            if entry[0] >> 3 != _LSM6DS_TAG_ACCEL:
+                continue
+            j = count * 3
+            buf[j], buf[j + 1], buf[j + 2] = struct.unpack_from("<hhh", entry, 1)
+            count += 1
+        return count
+
+
+# ========= TRACE FILE =========
+class TraceSensor(MotionSensor):
+    """
+    TraceSensor(path, *, scale=None, data_rate=100, loop=True)
+
+    Replays a trace file: one "x,y,z" line of raw counts per sample. Lines
+    starting with "#" are comments; a "# scale=<m/s^2 per count>" line sets
+    the scale (default: ADXL345 full resolution). At the end of the file it
+    starts over when loop is True, else raises EOFError.
+    """
+
+    def __init__(self, path, *, scale=None, data_rate=100, loop=True):
+        self.path = path
+        self.data_rate = data_rate
+        self.loop = loop
+        self.scale = _ADXL345_MG_PER_LSB * STANDARD_GRAVITY
+        self._file = open(path, "r")
+        self._read_header()
+        if scale is not None:
+            self.scale = scale
+
+    def _read_header(self):
+        while True:
+            pos = self._file.tell()
+            line = self._file.readline()
+            if not line.startswith("#"):
+                self._file.seek(pos)
+                self._data_start = pos
+                return
+            key, _, value = line[1:].strip().partition("=")
+            if key.strip() == "scale":
+                self.scale = float(value)
+
+    def read_raw(self):
+        while True:
+            line = self._file.readline()
+            if not line:
+                if not self.loop:
+                    raise EOFError("end of trace")
+                self._file.seek(self._data_start)
+                continue
+            if line[0] == "#" or not line.strip():
+                continue
+            x, y, z = line.split(",")[:3]
+            return int(x), int(y), int(z)
+
+    def read_batch(self, buf):
+        count = 0
+        for j in range(0, len(buf) - 2, 3):
+            try:
+                buf[j], buf[j + 1], buf[j + 2] = self.read_raw()
+            except EOFError:
+                break
+            count += 1
+        return count
+
+    def close(self):
+        self._file.close()
+
+
+def sample_buffer(samples):
+    """Return an array("h") that holds the given number of x, y, z samples."""
+    return array("h", (0 for _ in range(3 * samples)))
@@ -0,0 +1,99 @@
+class MovementDetector:
+    """
+    MovementDetector(*, threshold=5, required_reads=2, alpha=0.20, thresh_off=None)
+
+    Event-based direction detector for accelerometer samples.
+
+    - threshold: dominant-axis magnitude needed to consider movement
+    - required_reads: consecutive samples in the same direction to confirm an event
+    - alpha: EMA smoothing factor
+    - thresh_off: magnitude below which an active movement is released
+      (defaults to 0.6 * threshold)
+
+    Feed samples with update(x, y, z); it returns a dir_code in
+    {+X,-X,+Y,-Y,+Z,-Z} when a new movement is confirmed, else None.
+    """
+
+    def __init__(self, *, threshold=5, required_reads=2, alpha=0.20, thresh_off=None):
+        self.threshold = threshold
+        self.required_reads = required_reads
+        self.alpha = alpha
+        self.thresh_off = threshold * 0.6 if thresh_off is None else thresh_off
+
+        # Baseline and filtered values
+        self.bx = self.by = self.bz = 0.0
+        self.xf = self.yf = self.zf = 0.0
+
+        # Direction state
+        self.candidate_dir = None
+        self.candidate_count = 0
+        self.active_dir = None  # currently confirmed movement direction
+
+    def set_baseline(self, bx, by, bz):
+        self.bx = bx
+        self.by = by
+        self.bz = bz
+
+    def prime(self, x, y, z):
+        """Initialize the filtered values from one baseline-removed sample."""
+        self.xf = x - self.bx
+        self.yf = y - self.by
+        self.zf = z - self.bz
+
+    def ema(self, prev, raw):
+        return self.alpha * raw + (1.0 - self.alpha) * prev
+
+    @staticmethod
+    def axis_dir_from_values(x, y, z):
+        """Pick dominant axis and return dir_code in {+X,-X,+Y,-Y,+Z,-Z} and magnitude."""
+        ax_vals = [("X", x), ("Y", y), ("Z", z)]
+        axis, val = max(ax_vals, key=lambda t: abs(t[1]))
+        sign = "+" if val >= 0 else "-"
+        return f"{sign}{axis}", abs(val)
+
+    def update(self, x, y, z, use_baseline=True):
+        """
+        Update filters & state with one sample.
+        Return dir_code of new movement event if detected, else None.
+        """
+        # ---- Baseline removal ----
+        if use_baseline:
+            x -= self.bx
+            y -= self.by
+            z -= self.bz
+
+        # ---- EMA filtering ----
+        self.xf = self.ema(self.xf, x)
+        self.yf = self.ema(self.yf, y)
+        self.zf = self.ema(self.zf, z)
+
+        # ---- Dominant axis ----
+        dir_code, dom_val = self.axis_dir_from_values(self.xf, self.yf, self.zf)
+
+        # ---- Hysteresis & dwell ----
+        if self.active_dir:
+            # movement is active; wait until it calms down below thresh_off
+            if dom_val <= self.thresh_off:
+                self.active_dir = None
+            # no new event while still active
+            return None
+
+        if dom_val >= self.threshold:
+            # count consecutive readings in same direction
+            if dir_code == self.candidate_dir:
+                self.candidate_count += 1
+            else:
+                self.candidate_dir = dir_code
+                self.candidate_count = 1
+
+            if self.candidate_count >= self.required_reads:
+                # Confirm new movement event
+                self.active_dir = self.candidate_dir
+                self.candidate_dir = None
+                self.candidate_count = 0
+                return self.active_dir
+        else:
+            # below threshold -> reset candidate
+            self.candidate_dir = None
+            self.candidate_count = 0
+        return None
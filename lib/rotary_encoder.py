@@ -1,5 +1,5 @@
-import time
 import digitalio
+from ticks import ticks_ms, ticks_diff
 
 class RotaryEncoder:
     """
@@ -34,7 +34,7 @@ class RotaryEncoder:
 
         self._last_raw = (self._a.value, self._b.value)
         self._last_stable = self._last_raw
-        self._last_change_time = time.monotonic() * 1000.0 
+        self._last_change_time = ticks_ms()
 
         self._last_q = (1 if self._last_stable[0] else 0) << 1 | (1 if self._last_stable[1] else 0)
 
@@ -51,7 +51,7 @@ class RotaryEncoder:
         return (self._a.value, self._b.value)
 
     def update(self):
-        now = time.monotonic() * 1000.0
+        now = ticks_ms()
         raw = self._read_raw()
         if raw != self._last_raw:
             
@@ -59,7 +59,7 @@ class RotaryEncoder:
             self._last_change_time = now
             return False
 
-        if raw != self._last_stable and (now - self._last_change_time) >= self._debounce_ms:
+        if raw != self._last_stable and ticks_diff(now, self._last_change_time) >= self._debounce_ms:
             prev_q = self._last_q
             self._last_stable = raw
             curr_q = self._pack(raw)
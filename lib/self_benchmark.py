@@ -0,0 +1,160 @@
+"""
+On-device micro-benchmarks for field diagnosis.
+
+run_benchmarks() times the I2C sensor, the OLED, label updates, the
+NeoPixel and the rotary encoder on the real hardware, and reports free
+heap. result_line() turns the results into one machine-readable serial
+line ("BENCH {json}") for comparing units across the fleet.
+"""
+import gc
+import json
+import time
+
+import displayio
+import terminalio
+from adafruit_display_text import label
+
+from motion_sensor import sample_buffer
+
+
+def _mean_us(fn, iterations):
+    """Average time (us) of one fn() call over iterations calls."""
+    start = time.monotonic_ns()
+    for _ in range(iterations):
+        fn()
+    return (time.monotonic_ns() - start) / iterations / 1000
+
+
+def bench_sensor_read_us(sensor, iterations=200):
+    return _mean_us(sensor.read_raw, iterations)
+
+
+def bench_sensor_max_rate_hz(sensor, duration_ms=1000):
+    """
+    Samples per second the firmware can pull from the sensor, with the
+    sensor at its fastest data rate (and FIFO on, when it has one).
+    """
+    rates = getattr(sensor, "DATA_RATES", None)
+    has_fifo = hasattr(sensor, "fifo")
+    old_rate = sensor.data_rate
+    old_fifo = sensor.fifo if has_fifo else False
+    if rates:
+        sensor.data_rate = max(rates)
+    if has_fifo:
+        sensor.fifo = True
+
+    buf = sample_buffer(32)
+    count = 0
+    start = time.monotonic_ns()
+    end = start + duration_ms * 1000000
+    while True:
+        now = time.monotonic_ns()
+        if now >= end:
+            break
+        count += sensor.read_batch(buf)
+
+    if has_fifo:
+        sensor.fifo = old_fifo
+    if rates:
+        sensor.data_rate = old_rate
+    return count * 1000000000 / (now - start)
+
+
+def bench_display_refresh_ms(display, iterations=10):
+    """Return (full, partial) refresh time in ms."""
+    width, height = display.width, display.height
+    old_group = display.root_group
+    old_auto_refresh = display.auto_refresh
+    display.auto_refresh = False
+
+    group = displayio.Group()
+    bitmap = displayio.Bitmap(width, height, 2)
+    palette = displayio.Palette(2)
+    palette[0] = 0x000000
+    palette[1] = 0xFFFFFF
+    group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+    small = label.Label(terminalio.FONT, text="0", x=2, y=6)
+    group.append(small)
+    display.root_group = group
+    display.refresh()
+
+    state = [0]
+
+    def full():
+        state[0] ^= 1
+        bitmap.fill(state[0])  # every pixel changes
+        display.refresh()
+
+    def partial():
+        state[0] += 1
+        small.text = str(state[0] % 10)  # one character changes
+        display.refresh()
+
+    full_ms = _mean_us(full, iterations) / 1000
+    partial_ms = _mean_us(partial, iterations) / 1000
+
+    display.root_group = old_group
+    display.auto_refresh = old_auto_refresh
+    return full_ms, partial_ms
+
+
+def bench_label_update_us(iterations=100):
+    text_label = label.Label(terminalio.FONT, text="Time: 10s")
+    texts = ("Time: 9s", "Time: 10s")
+    state = [0]
+
+    def update():
+        state[0] ^= 1
+        text_label.text = texts[state[0]]
+
+    return _mean_us(update, iterations)
+
+
+def bench_pixels_show_us(pixels, iterations=100):
+    return _mean_us(pixels.show, iterations)
+
+
+def bench_encoder_update_us(encoder, iterations=500):
+    return _mean_us(encoder.update, iterations)
+
+
+def free_heap():
+    gc.collect()
+    mem_free = getattr(gc, "mem_free", None)
+    return mem_free() if mem_free else None
+
+
+def run_benchmarks(*, display, sensor, pixels, encoder):
+    """Run the whole suite and return a dict of results."""
+    results = {"heap_free": free_heap()}
+    results["accel_read_us"] = round(bench_sensor_read_us(sensor), 1)
+    results["accel_max_hz"] = round(bench_sensor_max_rate_hz(sensor))
+    full_ms, partial_ms = bench_display_refresh_ms(display)
+    results["oled_full_ms"] = round(full_ms, 2)
+    results["oled_partial_ms"] = round(partial_ms, 2)
+    results["label_update_us"] = round(bench_label_update_us(), 1)
+    results["pixel_show_us"] = round(bench_pixels_show_us(pixels), 1)
+    results["encoder_update_us"] = round(bench_encoder_update_us(encoder), 1)
+    results["heap_free_after"] = free_heap()
+    return results
+
+
+def result_line(results, **info):
+    """One serial line: BENCH followed by the results (and info) as JSON."""
+    record = dict(info)
+    record.update(results)
+    return "BENCH " + json.dumps(record)
+
+
+def result_lines(results):
+    """Short lines for the 128x64 OLED (21 characters each)."""
+    heap = results["heap_free"]
+    heap_text = "--" if heap is None else f"{heap // 1024}K"
+    return (
+        "SELF BENCHMARK",
+        f"Acc {results['accel_read_us']:.0f}us {results['accel_max_hz']}Hz",
+        f"OLED {results['oled_full_ms']:.1f}/{results['oled_partial_ms']:.1f}ms",
+        f"Lbl {results['label_update_us']:.0f}us Px {results['pixel_show_us']:.0f}us",
+        f"Enc {results['encoder_update_us']:.0f}us Heap {heap_text}",
+        "Press button",
+    )
@@ -0,0 +1,28 @@
+"""
+Integer millisecond time base.
+
+ticks_ms() is a wrapping integer millisecond counter (supervisor.ticks_ms on
+CircuitPython). Unlike float time.monotonic() it does not lose precision as
+uptime grows. Always compare ticks with ticks_diff(), never with "-" or "<",
+so the wraparound every 2**29 ms (~6.2 days) is handled. A difference is
+only valid up to 2**28 ms (~3.1 days): do not keep a timestamp around for
+longer than that (e.g. across a light sleep) and compare it afterwards.
+"""
+
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALFPERIOD = _TICKS_PERIOD // 2
+
+try:
+    from supervisor import ticks_ms
+except ImportError:
+    import time
+
+    def ticks_ms():
+        return (time.monotonic_ns() // 1000000) & _TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    """Signed difference ticks1 - ticks2 in ms, correct across wraparound."""
+    diff = (ticks1 - ticks2) & _TICKS_MAX
+    return ((diff + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
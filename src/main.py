@@ -1,9 +1,12 @@
+# integer millisecond time base (first, so time-to-resume covers the imports)
+from ticks import ticks_ms, ticks_diff
+BOOT_MS = ticks_ms()
 # python common libraries
 import time
 import random
 import board
-# accelerometer
-import adafruit_adxl34x
+# accelerometer (raw-count motion sensor backends)
+from motion_sensor import ADXL345Sensor
 # neopixel
 import neopixel
 # bus
@@ -14,15 +17,25 @@ import displayio
 import terminalio
 from adafruit_display_text import label
 import adafruit_displayio_ssd1306
-# button and rotary encoder
+# button (the rotary encoder is imported on first use)
 import digitalio
-from rotary_encoder import RotaryEncoder
+from debouncer import Debouncer
+# movement detection
+from movement_detector import MovementDetector
+# low-power idle (alarm is imported on first sleep)
+from idle_manager import IdleManager
+# seeded, precomputed level commands
+from level_plan import LevelPlan
+# crash-safe checkpoints in NVM
+import microcontroller
+from checkpoint import CheckpointStore
 
 
 # ========= PIN DEFINITIONS =========
 ENC_A_PIN = board.D7      # Rotary encoder A
 ENC_B_PIN = board.D8      # Rotary encoder B
 ENC_SW_PIN = board.D9     # Encoder push button (with pull-up)
+ACCEL_INT_PIN = board.D10  # ADXL345 INT1 (activity interrupt, active high)
 
 # ========= I2C & DEVICES INIT (OLED + ACCEL) =========
 displayio.release_displays()
@@ -33,50 +46,42 @@ display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
 
 # ACCELEROMETER
-accelerometer = adafruit_adxl34x.ADXL345(i2c)
+# Any motion_sensor backend works here (ADXL345Sensor, LSM6DSOXSensor, TraceSensor)
+ACCEL_RANGE_G = 2
+ACCEL_DATA_RATE = 100  # Hz
+accelerometer = ADXL345Sensor(i2c, range_g=ACCEL_RANGE_G, full_resolution=True,
+                              data_rate=ACCEL_DATA_RATE)
+# activity interrupt on INT1, used to wake from idle
+accelerometer.enable_activity_interrupt(threshold=18)
 
 # ========= ROTARY ENCODER INIT  =========
-encoder = RotaryEncoder(ENC_A_PIN, ENC_B_PIN,
-                        debounce_ms=3, pulses_per_detent=3)
+# Created on first use: resuming a checkpointed game does not need the menu
+encoder = None
+
+
+def get_encoder():
+    global encoder
+    if encoder is None:
+        from rotary_encoder import RotaryEncoder
+        encoder = RotaryEncoder(ENC_A_PIN, ENC_B_PIN,
+                                debounce_ms=3, pulses_per_detent=3)
+    return encoder
+
 
 # Button
 button = digitalio.DigitalInOut(ENC_SW_PIN)
 button.switch_to_input(pull=digitalio.Pull.UP)  # ACTIVE LOW
 
 # ------------- Debounce State (timer-based) -------------
-last_state = button.value       # immediate raw reading from last loop
-stable_state = button.value     # debounced (accepted) state
-last_time = time.monotonic()
-debounceDelay = 0.05
+DEBOUNCE_MS = 50
+debouncer = Debouncer(button, debounce_ms=DEBOUNCE_MS)
 
 
 def button_fell():
     """
     Return True exactly once when the button is PRESSED (debounced falling edge).
-    Uses the same timer-based debounce logic as your example.
     """
-    global last_state, stable_state, last_time
-
-    current_state = button.value
-    now = time.monotonic()
-
-    # If raw state changed, mark the time of this potential transition
-    if current_state != last_state:
-        last_time = now
-        last_state = current_state
-
-    # If the raw state has stayed unchanged longer than debounceDelay,
-    # accept it as the new stable state and trigger events accordingly.
-    if (now - last_time) > debounceDelay:
-        if stable_state != current_state:
-            # We have a debounced state change
-            stable_state = current_state
-
-            if not stable_state:
-                # stable_state == False means button is PRESSED (fell edge)
-                return True
-
-    return False
+    return debouncer.fell()
 
 
 # ========= NEOPIXEL INIT =========
@@ -110,88 +115,115 @@ USE_BASELINE = True
 BASELINE_SAMPLES = 100
 BASELINE_DELAY = 0.02
 
-# Baseline and filtered values
-bx = by = bz = 0.0
-xf = yf = zf = 0.0
+# The detector works on raw sensor counts; convert the thresholds once
+detector = MovementDetector(
+    threshold=THRESHOLD / accelerometer.scale, required_reads=REQUIRED_READS,
+    alpha=ALPHA, thresh_off=THRESH_OFF / accelerometer.scale)
 
-# Direction state
-candidate_dir = None
-candidate_count = 0
-active_dir = None  # currently confirmed movement direction
 
+def poll_movement_event():
+    """
+    Poll accelerometer once, update filters & state.
+    Return dir_code of new movement event if detected, else None.
+    Possible dir_code: {+X,-X,+Y,-Y,+Z,-Z}
+    """
+    x, y, z = accelerometer.read_raw()
+    return detector.update(x, y, z, use_baseline=USE_BASELINE)
 
-def ema(prev, raw, alpha=ALPHA):
-    return alpha * raw + (1.0 - alpha) * prev
 
+# ========= LOW-POWER IDLE =========
+IDLE_SLOW_AFTER_MS = 15000          # slower polling, dimmed NeoPixel
+IDLE_DISPLAY_OFF_AFTER_MS = 60000   # OLED and NeoPixel off
+IDLE_SLEEP_AFTER_MS = 180000        # light sleep until button / motion
+IDLE_SLEEP_WAKE_MS = 3600000        # brief timer wake while asleep (idle time accounting)
+# The button is still polled at <= DEBOUNCE_MS / 2 while idle (a press must
+# span two polls to be seen); SLOW_POLL saves power on the NeoPixel instead.
+IDLE_POLL_S = 0.02
+IDLE_BRIGHTNESS = BRIGHTNESS * 0.2
 
-def axis_dir_from_values(x, y, z):
-    """Pick dominant axis and return dir_code in {+X,-X,+Y,-Y,+Z,-Z} and magnitude."""
-    ax_vals = [("X", x), ("Y", y), ("Z", z)]
-    axis, val = max(ax_vals, key=lambda t: abs(t[1]))
-    sign = "+" if val >= 0 else "-"
-    return f"{sign}{axis}", abs(val)
 
+def motion_detected():
+    """Read (and clear) the ADXL345 activity interrupt."""
+    return accelerometer.activity()
 
-def poll_movement_event():
+
+def enter_light_sleep():
     """
-    Poll accelerometer once, update filters & state.
-    Return dir_code of new movement event if detected, else None.
-    Possible dir_code: {+X,-X,+Y,-Y,+Z,-Z}
+    Light sleep until the button is pressed or the ADXL345 sees motion.
+    Returns False if only the hourly timer woke it: the idle manager adds up
+    its time in pieces shorter than the ticks_diff() range and sleeps again.
     """
-    global xf, yf, zf, candidate_dir, candidate_count, active_dir
-
-    # ---- Read & baseline removal ----
-    x, y, z = accelerometer.acceleration
-    if USE_BASELINE:
-        x -= bx
-        y -= by
-        z -= bz
-
-    # ---- EMA filtering ----
-    xf = ema(xf, x)
-    yf = ema(yf, y)
-    zf = ema(zf, z)
-
-    # ---- Dominant axis ----
-    dir_code, dom_val = axis_dir_from_values(xf, yf, zf)
-
-    # ---- Hysteresis & dwell ----
-    if active_dir:
-        # movement is active; wait until it calms down below THRESH_OFF
-        if dom_val <= THRESH_OFF:
-            active_dir = None
-        # no new event while still active
-        return None
-    else:
-        if dom_val >= THRESHOLD:
-            # count consecutive readings in same direction
-            if dir_code == candidate_dir:
-                candidate_count += 1
-            else:
-                candidate_dir = dir_code
-                candidate_count = 1
-
-            if candidate_count >= REQUIRED_READS:
-                # Confirm new movement event
-                active_dir = candidate_dir
-                candidate_dir = None
-                candidate_count = 0
-                return active_dir
-        else:
-            # below threshold -> reset candidate
-            candidate_dir = None
-            candidate_count = 0
-            return None
+    global button, debouncer
+    import alarm
+
+    motion_detected()  # clear a latched activity interrupt before arming
+    button.deinit()    # PinAlarm needs the pin
+
+    button_alarm = alarm.pin.PinAlarm(pin=ENC_SW_PIN, value=False, pull=True)
+    motion_alarm = alarm.pin.PinAlarm(pin=ACCEL_INT_PIN, value=True)
+    # float monotonic() is only used for this relative, second-scale deadline
+    timer_alarm = alarm.time.TimeAlarm(monotonic_time=time.monotonic() + IDLE_SLEEP_WAKE_MS / 1000)
+    woken_by = alarm.light_sleep_until_alarms(button_alarm, motion_alarm, timer_alarm)
+
+    # RAM and display contents are kept; only the button needs re-creating.
+    # The new debouncer starts from the current (pressed) state, so the
+    # wake-up press is not also taken as a button press.
+    button = digitalio.DigitalInOut(ENC_SW_PIN)
+    button.switch_to_input(pull=digitalio.Pull.UP)
+    debouncer = Debouncer(button, debounce_ms=DEBOUNCE_MS)
+    return woken_by is not timer_alarm
+
+
+def on_idle_state_change(old, new):
+    if new >= IdleManager.DISPLAY_OFF > old:
+        # Gameplay swings latch the activity bit and nothing reads it while
+        # the screen is on; clear it so only new motion wakes the screen.
+        motion_detected()
+        display.sleep()
+        pixels.brightness = 0.0
+        pixels.show()
+    elif old >= IdleManager.DISPLAY_OFF > new:
+        display.wake()
+        pixels.brightness = BRIGHTNESS
+        pixels.show()
+        print(f"Idle time per state (ms): {idle.time_in_state_ms()}")
+    elif new == IdleManager.SLOW_POLL:
+        pixels.brightness = IDLE_BRIGHTNESS
+        pixels.show()
+    elif old == IdleManager.SLOW_POLL:
+        pixels.brightness = BRIGHTNESS
+        pixels.show()
+
+
+idle = IdleManager(slow_after_ms=IDLE_SLOW_AFTER_MS,
+                   display_off_after_ms=IDLE_DISPLAY_OFF_AFTER_MS,
+                   sleep_after_ms=IDLE_SLEEP_AFTER_MS,
+                   slow_poll_s=IDLE_POLL_S, display_off_poll_s=IDLE_POLL_S,
+                   on_state_change=on_idle_state_change,
+                   sleep_fn=enter_light_sleep)
 
 
 # ========= UI FUNCTIONS =========
-def wait_for_button():
-    """Block until debounced button press."""
+def wait_for_button(long_press_ms=0):
+    """
+    Block until debounced button press, stepping down power while idle.
+    With long_press_ms, return True if the press was held that long.
+    """
+    idle.activity()
     while True:
         if button_fell():
+            if idle.state >= IdleManager.DISPLAY_OFF:
+                # screen was off: this press only wakes it
+                idle.activity()
+                continue
+            idle.activity()
+            if long_press_ms and button_held_ms(long_press_ms) >= long_press_ms:
+                return True
             time.sleep(0.2)
-            return
-        time.sleep(0.01)
+            return False
+        # While the display is off, motion also wakes it
+        active = idle.state >= IdleManager.DISPLAY_OFF and motion_detected()
+        time.sleep(idle.step(active))
 
 
 def create_difficulty_screen(difficulties, selected_index):
@@ -205,6 +237,10 @@ def create_difficulty_screen(difficulties, selected_index):
 
     base_y = 25
     spacing = 15
+    if len(difficulties) > 3:
+        # hidden BENCH entry unlocked: squeeze four rows onto the screen
+        base_y = 22
+        spacing = 12
 
     for i, diff in enumerate(difficulties):
         txt = label.Label(
@@ -227,9 +263,8 @@ def create_difficulty_screen(difficulties, selected_index):
     return group
 
 
-def show_difficulty_screen(selected_index):
+def show_difficulty_screen(selected_index, difficulties=("EASY", "MEDIUM", "HARD")):
     """Show the difficulty screen."""
-    difficulties = ["EASY", "MEDIUM", "HARD"]
     group = create_difficulty_screen(difficulties, selected_index)
     display.root_group = group
 
@@ -277,7 +312,7 @@ def show_welcome_screen():
     wait_for_button()
 
 
-def show_level_ready_screen(difficulty, level):
+def show_level_ready_screen(difficulty, level, hint=None):
     group = displayio.Group()
 
     title = label.Label(
@@ -304,6 +339,9 @@ def show_level_ready_screen(difficulty, level):
     )
     group.append(msg2)
 
+    if hint:
+        group.append(label.Label(terminalio.FONT, text=hint, x=5, y=58))
+
     display.root_group = group
 
 
@@ -441,7 +479,7 @@ def show_calibration_screen_and_calibrate():
     1. Show "Loading... Keep still for 5" screen
     2. Sample accelerometer for 5 seconds, compute baseline offsets
     """
-    global bx, by, bz, xf, yf, zf, baseline_done
+    global baseline_done
 
     WIDTH = 128
     HEIGHT = 64
@@ -464,31 +502,30 @@ def show_calibration_screen_and_calibrate():
     display.root_group = group
 
     baseline_done = False
-    sx = sy = sz = 0.0
+    sx = sy = sz = 0
     count = 0
 
-    TOTAL_TIME = 5
+    TOTAL_MS = 5000
     SAMPLE_DELAY = 0.02
 
-    start = time.monotonic()
+    start = ticks_ms()
     last_second = 5  # for updating display
 
     while True:
-        now = time.monotonic()
-        elapsed = now - start
-        remain = TOTAL_TIME - elapsed
+        elapsed = ticks_diff(ticks_ms(), start)
+        remain = TOTAL_MS - elapsed
 
-        # Countdown number (integer seconds)
-        sec = max(0, int(remain) + 1)
+        # Countdown number (whole seconds left, rounded up: 5..1)
+        sec = max(0, (remain + 999) // 1000)
         if sec != last_second:
             countdown_label.text = str(sec)
             last_second = sec
 
-        if elapsed >= TOTAL_TIME:
+        if elapsed >= TOTAL_MS:
             break
 
         # Sample accelerometer
-        x, y, z = accelerometer.acceleration
+        x, y, z = accelerometer.read_raw()
         sx += x
         sy += y
         sz += z
@@ -498,45 +535,69 @@ def show_calibration_screen_and_calibrate():
 
     # Finished sampling, compute baseline
     if count > 0:
-        bx = sx / count
-        by = sy / count
-        bz = sz / count
+        detector.set_baseline(sx / count, sy / count, sz / count)
 
     # Initialize filtered values
-    x0, y0, z0 = accelerometer.acceleration
-    x0 -= bx
-    y0 -= by
-    z0 -= bz
-    xf = x0
-    yf = y0
-    zf = z0
+    detector.prime(*accelerometer.read_raw())
 
     baseline_done = True
-    print(f"Baseline calibrated: bx={bx}, by={by}, bz={bz}")
+    print(f"Baseline calibrated (counts): bx={detector.bx}, by={detector.by}, bz={detector.bz}")
 
 
 # ========= MAIN GAME LOGIC =========
+BENCH_HOLD_MS = 2000  # hold the button this long on the menu to reveal BENCH
+
+
+def button_held_ms(limit_ms):
+    """After a press, wait for release (up to limit_ms); return how long it was held."""
+    start = ticks_ms()
+    while True:
+        held = ticks_diff(ticks_ms(), start)
+        if held >= limit_ms:
+            return held
+        debouncer.fell()
+        if debouncer.value:
+            return held
+        time.sleep(0.01)
+
+
 def select_difficulty():
     difficulties = ["EASY", "MEDIUM", "HARD"]
 
     selected = 0  # start at EASY
+    encoder = get_encoder()
+    # only deltas matter here; restart from 0 so the position stays small
+    encoder.reset()
     last_pos = encoder.position
 
     show_difficulty_screen(selected)
 
     # encoder move "cooldown": minimum time between menu steps
-    STEP_INTERVAL = 0.08  # 80 ms, you can tune this (0.05 ~ 0.1)
-    last_step_time = time.monotonic()
+    STEP_INTERVAL_MS = 80  # you can tune this (50 ~ 100)
+    last_step_time = ticks_ms()
+    cooling_down = True
 
     # movement accumulation for step detection
     move_accum = 0
     STEP_THRESHOLD = 2
 
+    idle.activity()
     while True:
-        now = time.monotonic()
+        now = ticks_ms()
+        # End the cooldown on the first poll after it: the menu can sit in
+        # light sleep for days, and ticks_diff() against a timestamp older
+        # than 2**28 ms would come out negative.
+        if cooling_down and ticks_diff(now, last_step_time) > STEP_INTERVAL_MS:
+            cooling_down = False
 
         # --- Rotary encoder update ---
         changed = encoder.update()
+        if changed and idle.state >= IdleManager.DISPLAY_OFF:
+            # first turn after idling only wakes the device
+            idle.activity()
+            last_pos = encoder.position
+            move_accum = 0
+            changed = False
         if changed:
             pos = encoder.position
             delta = pos - last_pos
@@ -546,20 +607,33 @@ def select_difficulty():
             move_accum += abs(delta)
 
             # Only switch difficulty when accumulated steps are enough and time interval is sufficient
-            if (now - last_step_time) > STEP_INTERVAL and move_accum >= STEP_THRESHOLD:
+            if not cooling_down and move_accum >= STEP_THRESHOLD:
                 # Always move in one direction: EASY -> MEDIUM -> HARD -> EASY ->
                 selected = (selected + 1) % len(difficulties)
-                show_difficulty_screen(selected)
+                show_difficulty_screen(selected, difficulties)
 
                 last_step_time = now      # reset cooldown timer
+                cooling_down = True
                 move_accum = 0           # reset accumulation for next step
 
         if button_fell():
+            if idle.state >= IdleManager.DISPLAY_OFF:
+                # screen was off: wake up instead of selecting blindly
+                idle.activity()
+                continue
+            idle.activity()
+            if button_held_ms(BENCH_HOLD_MS) >= BENCH_HOLD_MS and "BENCH" not in difficulties:
+                # long press: reveal the hidden self-benchmark entry
+                difficulties.append("BENCH")
+                selected = len(difficulties) - 1
+                show_difficulty_screen(selected, difficulties)
+                continue
             # confirmed selection
             time.sleep(0.2)
             return difficulties[selected]
 
-        time.sleep(0.001)
+        active = changed or (idle.state >= IdleManager.DISPLAY_OFF and motion_detected())
+        time.sleep(idle.step(active, poll_s=0.001))
 
 
 def dir_code_to_command(dir_code):
@@ -580,26 +654,27 @@ def dir_code_to_command(dir_code):
         return None
 
 
-def get_time_limit(difficulty):
+def get_time_limit_ms(difficulty):
     if difficulty == "EASY":
-        return 10.0
+        return 10000
     elif difficulty == "MEDIUM":
-        return 5.0
+        return 5000
     elif difficulty == "HARD":
-        return 3.0
+        return 3000
     else:
-        return 5.0
-
+        return 5000
 
-ALL_COMMANDS = ["FORWARD", "BACKWARD", "LEFT", "RIGHT"]
 
+# Level plan: all commands of a game are generated from one seed at game
+# start. The seed is printed over serial; set REPLAY_SEED to it to play the
+# exact same commands again (on the device or in tools/soak_test.py).
+REPLAY_SEED = None
+PLAN_MAX_RUN = 2        # no direction three times in a row
+PLAN_BALANCED = True    # direction counts per level differ by at most one
+PLAN_MIN_REVERSALS = 1  # at least one direct reversal (e.g. LEFT, RIGHT) per level
 
-def generate_command_sequence(level):
-    length = level + 2
-    return [random.choice(ALL_COMMANDS) for _ in range(length)]
 
-
-def play_one_level(difficulty, level):
+def play_one_level(difficulty, level, commands, ready_shown=False):
     """
     Play one level of the game.
     Returns True if passed, False if failed.
@@ -612,15 +687,16 @@ def play_one_level(difficulty, level):
             - Else: fail, red light, return False
     3. If all commands passed: return True
     4. Overall time limit per command depends on difficulty
+    With ready_shown, step 1 has already been done (fast resume).
     """
-    time_limit = get_time_limit(difficulty)   # EASY=10s, MED=5s, HARD=1s
-    commands = generate_command_sequence(level)
+    time_limit_ms = get_time_limit_ms(difficulty)   # EASY=10s, MED=5s, HARD=3s
     total_steps = len(commands)
 
     # Step 1: Show "Get Ready" screen and wait for button
-    show_level_ready_screen(difficulty, level)
-    show_color(COLOR_BLUE)  # ready state
-    wait_for_button()
+    if not ready_shown:
+        show_level_ready_screen(difficulty, level)
+        show_color(COLOR_BLUE)  # ready state
+        wait_for_button()
 
     # Complete each command in sequence
     for idx, cmd in enumerate(commands):
@@ -630,23 +706,22 @@ def play_one_level(difficulty, level):
         show_color(COLOR_YELLOW)  # current command in progress
 
         # Start timer for each command
-        start_time = time.monotonic()
+        start_time = ticks_ms()
 
         # Wait for the first movement of this command
         while True:
-            now = time.monotonic()
-            elapsed = now - start_time
+            elapsed = ticks_diff(ticks_ms(), start_time)
 
-            remaining = time_limit - elapsed
+            remaining = time_limit_ms - elapsed
 
             # Update countdown display (integer seconds for clarity)
             if remaining < 0:
                 remaining = 0
             # For example: Time: 3s
-            timer_label.text = f"Time: {int(remaining)}s"
+            timer_label.text = f"Time: {remaining // 1000}s"
 
             # Level timeout → fail
-            if elapsed > time_limit:
+            if elapsed > time_limit_ms:
                 show_color(COLOR_RED)
                 return False
 
@@ -696,32 +771,110 @@ def blink_congrats_led():
             time.sleep(0.02)
 
 
-def play_game(difficulty):
+def play_game(difficulty, start_level=1, seed=None, resumed=False):
+    """
+    Play levels start_level..10. At every level boundary the game state
+    (difficulty, level, plan seed, calibration baseline) is checkpointed to
+    NVM, so a reset or brown-out resumes at that level (see resume_game()).
+    """
     MAX_LEVEL = 10
-    for level in range(1, MAX_LEVEL + 1):
-        passed = play_one_level(difficulty, level)
+    if seed is None:
+        seed = REPLAY_SEED if REPLAY_SEED is not None else random.getrandbits(32)
+    plan = LevelPlan(seed, levels=MAX_LEVEL, max_run=PLAN_MAX_RUN,
+                     balanced=PLAN_BALANCED, min_reversals=PLAN_MIN_REVERSALS)
+    print(f"Level plan seed={plan.seed} (from L{start_level})")
+    for level in range(start_level, MAX_LEVEL + 1):
+        if not (resumed and level == start_level):  # already in NVM
+            checkpoints.save(difficulty, level, seed,
+                             (detector.bx, detector.by, detector.bz))
+        passed = play_one_level(difficulty, level, plan.commands(level),
+                                ready_shown=resumed and level == start_level)
         if not passed:
+            checkpoints.clear()
             show_fail_screen(difficulty, level)
             wait_for_button()   # Press to return to difficulty selection
             return  # Game over, return to main() to reselect difficulty
 
     # If we reach here, it means levels 1-10 were all passed
+    checkpoints.clear()
     show_congrats_screen(difficulty)
     blink_congrats_led()  # Press button to exit
     # Return to main()
 
 
+def run_self_benchmark():
+    """Hidden BENCH menu entry: time the hardware, show results, print one line."""
+    import gc
+    import os
+    import self_benchmark
+
+    group = displayio.Group()
+    group.append(label.Label(terminalio.FONT, text="Benchmarking...", x=5, y=30))
+    display.root_group = group
+    show_color(COLOR_BLUE)
+
+    gc.collect()
+    results = self_benchmark.run_benchmarks(
+        display=display, sensor=accelerometer, pixels=pixels, encoder=get_encoder())
+    print(self_benchmark.result_line(
+        results, board=board.board_id, firmware=os.uname().version,
+        sensor=type(accelerometer).__name__))
+
+    group = displayio.Group()
+    for i, text in enumerate(self_benchmark.result_lines(results)):
+        group.append(label.Label(terminalio.FONT, text=text, x=0, y=5 + i * 11))
+    display.root_group = group
+    show_color(COLOR_GREEN)
+    wait_for_button()
+
+
+# ========= FAST RESUME =========
+RESUME_HOLD_MS = 2000  # hold the button on the resume screen to discard the game
+
+checkpoints = CheckpointStore(microcontroller.nvm)
+
+
+def resume_game():
+    """
+    If NVM holds a game in progress, go straight to its level-ready screen,
+    skipping the welcome, menu and calibration screens (the saved baseline
+    is reused). Returns False if there is nothing to resume or the player
+    holds the button to start a new game instead.
+    """
+    saved = checkpoints.load()
+    if saved is None:
+        return False
+
+    detector.set_baseline(*saved.baseline)
+    show_level_ready_screen(saved.difficulty, saved.level, hint="Hold: new game")
+    show_color(COLOR_BLUE)
+    print(f"Resume {saved}: ready {ticks_diff(ticks_ms(), BOOT_MS)} ms after start")
+
+    if wait_for_button(long_press_ms=RESUME_HOLD_MS):
+        checkpoints.clear()
+        return False
+
+    detector.prime(*accelerometer.read_raw())
+    play_game(saved.difficulty, start_level=saved.level, seed=saved.seed, resumed=True)
+    return True
+
+
 def main():
     show_color(COLOR_BLUE)
-    show_welcome_screen()
+    if not resume_game():
+        show_welcome_screen()
     while True:
         show_color(COLOR_YELLOW)
 
         difficulty = select_difficulty()
+        if difficulty == "BENCH":
+            run_self_benchmark()
+            continue
 
         show_calibration_screen_and_calibrate()
 
         play_game(difficulty)
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Offline, NumPy-vectorized version of the movement detector.
+
+Runs the same pipeline as lib/movement_detector.py (baseline removal, EMA,
+dominant axis, hysteresis, dwell) over whole arrays of samples, and emits
+exactly the same event indices and dir_codes as feeding the samples one by
+one to MovementDetector.update().
+
+Usage (host only, needs numpy; scipy is used for the EMA when installed):
+
+    python tools/detector_batch.py trace.csv        # print events of a trace
+    python tools/detector_batch.py --verify         # equivalence checks vs scalar
+    python tools/detector_batch.py --bench 1000000  # verify + time both versions
+
+A trace uses the TraceSensor format from lib/motion_sensor.py: one
+"x,y,z" line of raw sensor counts per sample and an optional
+"# scale=<m/s^2 per count>" header. Thresholds are given in m/s^2 and
+converted to counts once, as src/main.py does.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
+from movement_detector import MovementDetector  # noqa: E402
+
+# dir_code for each (axis * 2 + negative) index
+DIR_CODES = ("+X", "-X", "+Y", "-Y", "+Z", "-Z")
+
+# Game thresholds (m/s^2) and the ADXL345 full-resolution scale (m/s^2 per count)
+THRESHOLD = 5
+ADXL345_SCALE = 0.004 * 9.80665
+
+
+def ema_filter(raw, alpha, initial):
+    """
+    EMA of one axis: out[i] = alpha * raw[i] + (1 - alpha) * out[i - 1].
+
+    Computed as a first order recursive filter. Both paths evaluate the same
+    three rounded float operations per sample as MovementDetector.ema(), so
+    the result is bit-exact with the scalar version.
+    """
+    decay = 1.0 - alpha
+    if lfilter is not None:
+        out, _ = lfilter([alpha], [1.0, -decay], raw, zi=[decay * initial])
+        return out
+
+    out = np.empty(len(raw))
+    prev = float(initial)
+    for i, value in enumerate(raw.tolist()):
+        prev = alpha * value + decay * prev
+        out[i] = prev
+    return out
+
+
+def dominant_axis(xf, yf, zf):
+    """Return (dir index into DIR_CODES, magnitude) for every sample."""
+    filtered = np.stack((xf, yf, zf), axis=1)
+    # argmax keeps the first axis on ties, like max() in the scalar version
+    axis = np.argmax(np.abs(filtered), axis=1)
+    val = filtered[np.arange(len(filtered)), axis]
+    negative = ~(val >= 0)
+    return axis * 2 + negative, np.abs(val)
+
+
+def detect_events(samples, *, baseline=(0.0, 0.0, 0.0), initial=(0.0, 0.0, 0.0),
+                  threshold=5, required_reads=2, alpha=0.20, thresh_off=None,
+                  use_baseline=True):
+    """
+    Run the detector over an (n, 3) array of samples.
+
+    - baseline: (bx, by, bz) offsets, as set by MovementDetector.set_baseline()
+    - initial: filtered values (xf, yf, zf) before the first sample,
+      as set by MovementDetector.prime()
+
+    The detector starts idle (no candidate, no active movement).
+    Returns (indices, dir_codes): sample indices where an event fired and the
+    dir_code of each event.
+    """
+    if thresh_off is None:
+        thresh_off = threshold * 0.6
+
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1, 3)
+    n = len(samples)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), []
+
+    # ---- Baseline removal & EMA filtering ----
+    axes = []
+    for k in range(3):
+        raw = samples[:, k]
+        if use_baseline:
+            raw = raw - baseline[k]
+        axes.append(ema_filter(raw, alpha, initial[k]))
+
+    # ---- Dominant axis ----
+    code, dom = dominant_axis(*axes)
+
+    # ---- Runs of consecutive readings above threshold in one direction ----
+    idx = np.arange(n)
+    hot = dom >= threshold
+    same_as_prev = np.zeros(n, dtype=bool)
+    same_as_prev[1:] = hot[1:] & hot[:-1] & (code[1:] == code[:-1])
+    is_start = hot & ~same_as_prev
+    run_start = np.maximum.accumulate(np.where(is_start, idx, 0))
+    is_end = np.zeros(n, dtype=bool)
+    is_end[:-1] = hot[:-1] & ~same_as_prev[1:]
+    is_end[-1] = hot[-1]
+    run_end = np.minimum.accumulate(np.where(is_end, idx, n)[::-1])[::-1]
+
+    # A run confirms an event on its required_reads-th sample
+    need = max(1, required_reads)
+    cand_mask = hot & (idx - run_start + 1 == need)
+    cand = idx[cand_mask]
+    cand_start = cand - (need - 1)
+
+    # Samples that release an active movement
+    calm = idx[dom <= thresh_off]
+
+    # ---- Hysteresis & dwell: one pass per event ----
+    events = []
+    pos = 0  # first sample where the detector is idle with no candidate
+    while pos < n:
+        event = -1
+        # A run already in progress when the detector went idle only counts
+        # from pos (possible when thresh_off >= threshold)
+        if hot[pos] and run_start[pos] < pos and run_end[pos] >= pos + need - 1:
+            event = pos + need - 1
+        else:
+            k = np.searchsorted(cand_start, pos)
+            if k < len(cand):
+                event = int(cand[k])
+        if event < 0:
+            break
+        events.append(event)
+
+        # Active until a sample drops to thresh_off; that sample only releases
+        k = np.searchsorted(calm, event, side="right")
+        if k >= len(calm):
+            break
+        pos = int(calm[k]) + 1
+
+    indices = np.asarray(events, dtype=np.int64)
+    return indices, [DIR_CODES[c] for c in code[indices]]
+
+
+def detect_events_scalar(samples, *, baseline=(0.0, 0.0, 0.0), initial=(0.0, 0.0, 0.0),
+                         threshold=5, required_reads=2, alpha=0.20, thresh_off=None,
+                         use_baseline=True):
+    """Reference: feed samples one by one to MovementDetector."""
+    detector = MovementDetector(threshold=threshold, required_reads=required_reads,
+                                alpha=alpha, thresh_off=thresh_off)
+    detector.set_baseline(*baseline)
+    detector.xf, detector.yf, detector.zf = initial
+
+    indices = []
+    codes = []
+    for i, (x, y, z) in enumerate(np.asarray(samples, dtype=np.float64).tolist()):
+        dir_code = detector.update(x, y, z, use_baseline=use_baseline)
+        if dir_code:
+            indices.append(i)
+            codes.append(dir_code)
+    return np.asarray(indices, dtype=np.int64), codes
+
+
+def synthetic_trace(n, seed=0, rate_hz=100, scale=ADXL345_SCALE):
+    """Noisy at-rest trace with random arm movements on all axes, in raw counts."""
+    rng = np.random.default_rng(seed)
+    samples = rng.normal(0.0, 0.6, size=(n, 3))
+    samples[:, 2] += 9.81
+
+    i = int(rng.integers(0, rate_hz))
+    while i < n:
+        length = int(rng.integers(rate_hz // 10, rate_hz // 2))
+        axis = int(rng.integers(0, 3))
+        peak = rng.uniform(3.0, 20.0) * rng.choice((-1.0, 1.0))
+        pulse = peak * np.sin(np.linspace(0.0, np.pi, length))
+        end = min(n, i + length)
+        samples[i:end, axis] += pulse[:end - i]
+        i = end + int(rng.integers(0, rate_hz * 2))
+    return np.round(samples / scale).astype(np.int16)
+
+
+def load_trace(path):
+    """Return (samples, scale) of a TraceSensor trace file."""
+    scale = ADXL345_SCALE
+    with open(path) as trace:
+        for line in trace:
+            if not line.startswith("#"):
+                break
+            key, _, value = line[1:].strip().partition("=")
+            if key.strip() == "scale":
+                scale = float(value)
+    return np.loadtxt(path, delimiter=",", comments="#", ndmin=2)[:, :3], scale
+
+
+def count_thresholds(params, scale):
+    """Convert threshold / thresh_off in params from m/s^2 to counts."""
+    params = dict(params)
+    params["threshold"] = params.get("threshold", THRESHOLD) / scale
+    if params.get("thresh_off") is not None:
+        params["thresh_off"] = params["thresh_off"] / scale
+    return params
+
+
+VERIFY_CASES = (
+    {},
+    {"required_reads": 1},
+    {"required_reads": 4},
+    {"threshold": 3, "alpha": 0.5},
+    {"threshold": 5, "thresh_off": 5},
+    {"threshold": 5, "thresh_off": 7},
+    {"use_baseline": False, "threshold": 12},
+)
+
+
+def verify(n=200_000, seeds=range(5)):
+    """Compare batch and scalar output; return the number of mismatching cases."""
+    failures = 0
+    for seed in seeds:
+        samples = synthetic_trace(n, seed=seed)
+        baseline = tuple(samples[:500].mean(axis=0))
+        initial = tuple(samples[500] - np.asarray(baseline))
+        for params in VERIFY_CASES:
+            kwargs = dict(count_thresholds(params, ADXL345_SCALE),
+                          baseline=baseline, initial=initial)
+            got_idx, got_codes = detect_events(samples, **kwargs)
+            want_idx, want_codes = detect_events_scalar(samples, **kwargs)
+            ok = np.array_equal(got_idx, want_idx) and got_codes == want_codes
+            if not ok:
+                failures += 1
+            print(f"seed={seed} {params or 'defaults'}: "
+                  f"{len(want_idx)} events {'OK' if ok else 'MISMATCH'}")
+    return failures
+
+
+def bench(n, seed=0, repeat=3):
+    samples = synthetic_trace(n, seed=seed)
+    baseline = tuple(samples[:500].mean(axis=0))
+
+    def best_of(fn):
+        best = None
+        result = None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = fn(samples, baseline=baseline,
+                        threshold=THRESHOLD / ADXL345_SCALE)
+            dt = time.perf_counter() - t0
+            best = dt if best is None else min(best, dt)
+        return best, result
+
+    t_batch, (got_idx, got_codes) = best_of(detect_events)
+    t_scalar, (want_idx, want_codes) = best_of(detect_events_scalar)
+    same = np.array_equal(got_idx, want_idx) and got_codes == want_codes
+
+    ema_impl = "scipy.signal.lfilter" if lfilter is not None else "python loop"
+    print(f"samples={n} events={len(want_idx)} ema={ema_impl}")
+    print(f"scalar: {t_scalar:.3f}s ({t_scalar / n * 1e6:.2f} us/sample)")
+    print(f"batch:  {t_batch:.3f}s ({t_batch / n * 1e6:.2f} us/sample)")
+    print(f"speedup: {t_scalar / t_batch:.1f}x, identical events: {same}")
+    return same
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("trace", nargs="?", help="x,y,z text trace to replay")
+    parser.add_argument("--verify", action="store_true",
+                        help="check batch output against the scalar detector")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="time both versions on an N-sample synthetic trace")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        if verify():
+            return 1
+    if args.bench:
+        if not bench(args.bench):
+            return 1
+    if args.trace:
+        samples, scale = load_trace(args.trace)
+        indices, codes = detect_events(samples, baseline=tuple(samples[:100].mean(axis=0)),
+                                       **count_thresholds({}, scale))
+        for i, dir_code in zip(indices.tolist(), codes):
+            print(f"{i},{dir_code}")
+    elif not (args.verify or args.bench):
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
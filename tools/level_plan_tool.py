@@ -0,0 +1,84 @@
+"""
+Print and check the seeded level plans of lib/level_plan.py.
+
+The game prints "Level plan seed=<seed>" at the start of every game. The
+same seed gives the same commands on the device and on the host, so a
+session can be inspected here and replayed (REPLAY_SEED in src/main.py, or
+tools/soak_test.py --replay-seed).
+
+    python tools/level_plan_tool.py 12345             # commands of every level
+    python tools/level_plan_tool.py --check 10000     # constraints over 10000 seeds
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
+from level_plan import LevelPlan  # noqa: E402
+
+ARROWS = "^v<>"  # COMMAND_ARROW of src/main.py, by code
+
+
+def show(plan):
+    print(f"seed={plan.seed} levels={plan.levels} bytes={len(plan.data)} "
+          f"data={plan.data.hex()}")
+    for level in range(1, plan.levels + 1):
+        codes = plan.codes(level)
+        print(f"L{level:<2} {''.join(ARROWS[c] for c in codes):<12}  "
+              f"{' '.join(plan.commands(level))}")
+
+
+def check(seeds, **constraints):
+    """Generate plans for seeds; return the number of levels breaking a constraint."""
+    failures = 0
+    reversal_total = 0
+    started = time.perf_counter()
+    for seed in range(seeds):
+        try:
+            plan = LevelPlan(seed, **constraints)
+        except ValueError as exc:
+            failures += 1
+            print(f"seed={seed}: {exc}")
+            continue
+        for level in range(1, plan.levels + 1):
+            codes = plan.codes(level)
+            counts = [codes.count(c) for c in range(4)]
+            ok = len(codes) == plan.level_length(level) and plan.satisfied(codes)
+            if plan.balanced:
+                ok = ok and max(counts) - min(counts) <= 1
+            if not ok:
+                failures += 1
+                print(f"seed={seed} L{level}: {codes} breaks the constraints")
+            reversal_total += sum(1 for a, b in zip(codes, codes[1:]) if b == a ^ 1)
+    elapsed = time.perf_counter() - started
+    print(f"{seeds} plans, {failures} bad levels, "
+          f"{reversal_total / max(1, seeds):.1f} reversals per game, "
+          f"{elapsed / max(1, seeds) * 1e6:.0f} us per plan (host)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("seed", nargs="?", type=int, help="plan seed to print")
+    parser.add_argument("--check", type=int, metavar="N",
+                        help="check the constraints for seeds 0..N-1")
+    parser.add_argument("--max-run", type=int, default=2)
+    parser.add_argument("--min-reversals", type=int, default=1)
+    parser.add_argument("--unbalanced", action="store_true")
+    args = parser.parse_args(argv)
+
+    constraints = {"max_run": args.max_run, "min_reversals": args.min_reversals,
+                   "balanced": not args.unbalanced}
+    if args.seed is not None:
+        show(LevelPlan(args.seed, **constraints))
+    if args.check:
+        if check(args.check, **constraints):
+            return 1
+    if args.seed is None and not args.check:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
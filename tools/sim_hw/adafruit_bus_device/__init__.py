@@ -0,0 +1 @@
+"""Simulated adafruit_bus_device package."""
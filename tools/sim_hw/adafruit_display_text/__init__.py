@@ -0,0 +1 @@
+"""Simulated adafruit_display_text package."""
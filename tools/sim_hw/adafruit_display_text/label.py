@@ -0,0 +1,11 @@
+"""Simulated adafruit_display_text.label: a Label just remembers its text."""
+
+
+class Label:
+    def __init__(self, font, *, text="", x=0, y=0, color=0xFFFFFF, **_kwargs):
+        self.font = font
+        self.text = text
+        self.x = x
+        self.y = y
+        self.color = color
+        self.hidden = False
@@ -0,0 +1,20 @@
+"""Simulated SSD1306 OLED."""
+
+
+class SSD1306:
+    def __init__(self, bus, *, width, height, **_kwargs):
+        self.bus = bus
+        self.width = width
+        self.height = height
+        self.root_group = None
+        self.is_awake = True
+        self.auto_refresh = True
+
+    def sleep(self):
+        self.is_awake = False
+
+    def wake(self):
+        self.is_awake = True
+
+    def refresh(self, **_kwargs):
+        return True
@@ -0,0 +1,14 @@
+"""
+Simulated alarm module. light_sleep_until_alarms() calls sleep_hook(alarms),
+which the simulation sets to advance the virtual clock until a wake event.
+"""
+from . import pin, time  # noqa: F401
+
+sleep_hook = None
+wake_alarm = None
+
+
+def light_sleep_until_alarms(*alarms):
+    global wake_alarm
+    wake_alarm = sleep_hook(alarms) if sleep_hook else alarms[0]
+    return wake_alarm
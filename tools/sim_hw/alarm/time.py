@@ -0,0 +1,14 @@
+"""
+Simulated alarm.time. monotonic_time is taken relative to the host's
+time.monotonic(); wake_ms is the same moment on the virtual clock.
+"""
+import time
+
+import clock
+
+
+class TimeAlarm:
+    def __init__(self, *, monotonic_time=None, epoch_time=None):
+        self.monotonic_time = monotonic_time
+        self.epoch_time = epoch_time
+        self.wake_ms = clock.now_ms + int(round((monotonic_time - time.monotonic()) * 1000))
@@ -0,0 +1,25 @@
+"""Simulated board pins of the Xiao ESP32-C3."""
+
+board_id = "seeed_xiao_esp32c3"
+
+
+class Pin:
+    def __init__(self, name):
+        self.name = name
+        self.level = None  # driven by the simulation; None = floating
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+
+D0 = Pin("D0")
+D1 = Pin("D1")
+D2 = Pin("D2")
+D3 = Pin("D3")
+D6 = Pin("D6")
+D7 = Pin("D7")
+D8 = Pin("D8")
+D9 = Pin("D9")
+D10 = Pin("D10")
+SDA = D4 = Pin("D4")
+SCL = D5 = Pin("D5")
@@ -0,0 +1,34 @@
+"""Simulated busio. I2C transfers go to the register models in i2c_devices."""
+import i2c_devices
+
+
+class I2C:
+    def __init__(self, scl, sda, *, frequency=100000):
+        self.scl = scl
+        self.sda = sda
+        self.frequency = frequency
+        self.devices = i2c_devices.default_devices()
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        self.devices[address].write(bytes(buffer[start:end]))
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        end = len(buffer) if end is None else end
+        buffer[start:end] = self.devices[address].read(end - start)
+
+    def writeto_then_readfrom(self, address, out_buffer, in_buffer, *, out_start=0,
+                              out_end=None, in_start=0, in_end=None):
+        self.writeto(address, out_buffer, start=out_start, end=out_end)
+        self.readfrom_into(address, in_buffer, start=in_start, end=in_end)
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def deinit(self):
+        pass
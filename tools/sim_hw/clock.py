@@ -0,0 +1,13 @@
+"""Shared virtual clock for the simulated hardware (integer milliseconds)."""
+
+now_ms = 0
+
+
+def set_ms(ms):
+    global now_ms
+    now_ms = int(ms)
+
+
+def advance_ms(ms):
+    global now_ms
+    now_ms += int(ms)
@@ -0,0 +1,39 @@
+"""Simulated digitalio: a pin's input level is set by the simulation via Pin.level."""
+
+
+class Pull:
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class Direction:
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class DigitalInOut:
+    def __init__(self, pin):
+        self._pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+
+    def switch_to_input(self, pull=None):
+        self.direction = Direction.INPUT
+        self.pull = pull
+        if self._pin.level is None:
+            self._pin.level = pull == Pull.UP
+
+    def switch_to_output(self, value=False, **_kwargs):
+        self.direction = Direction.OUTPUT
+        self._pin.level = value
+
+    @property
+    def value(self):
+        return bool(self._pin.level)
+
+    @value.setter
+    def value(self, value):
+        self._pin.level = value
+
+    def deinit(self):
+        pass
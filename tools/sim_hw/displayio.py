@@ -0,0 +1,75 @@
+"""Simulated displayio: keeps the object tree so a simulation can read the screen."""
+
+
+def release_displays():
+    pass
+
+
+class Group:
+    def __init__(self, *, scale=1, x=0, y=0):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._layers = []
+
+    def append(self, layer):
+        self._layers.append(layer)
+
+    def insert(self, index, layer):
+        self._layers.insert(index, layer)
+
+    def remove(self, layer):
+        self._layers.remove(layer)
+
+    def pop(self, i=-1):
+        return self._layers.pop(i)
+
+    def __len__(self):
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+
+class Bitmap:
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self._data = bytearray(width * height)
+
+    def __setitem__(self, xy, value):
+        x, y = xy
+        self._data[y * self.width + x] = value
+
+    def __getitem__(self, xy):
+        x, y = xy
+        return self._data[y * self.width + x]
+
+    def fill(self, value):
+        self._data[:] = bytes((value,)) * len(self._data)
+
+
+class Palette:
+    def __init__(self, color_count):
+        self._colors = [0] * color_count
+
+    def __setitem__(self, index, color):
+        self._colors[index] = color
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __len__(self):
+        return len(self._colors)
+
+
+class TileGrid:
+    def __init__(self, bitmap, *, pixel_shader, x=0, y=0, **_kwargs):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
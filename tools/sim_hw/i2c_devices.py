@@ -0,0 +1,102 @@
+"""Register-level models of the I2C devices on the board."""
+import struct
+
+
+class RegisterDevice:
+    """Byte registers with an auto-incrementing register pointer."""
+
+    def __init__(self, size=128):
+        self.registers = bytearray(size)
+        self.pointer = 0
+
+    def write(self, data):
+        if not data:
+            return
+        self.pointer = data[0]
+        for offset, value in enumerate(data[1:]):
+            self.write_register(self.pointer + offset, value)
+
+    def read(self, length):
+        out = bytes(self.read_register(self.pointer + i) for i in range(length))
+        return out
+
+    def write_register(self, register, value):
+        self.registers[register] = value
+
+    def read_register(self, register):
+        return self.registers[register]
+
+
+class ADXL345Model(RegisterDevice):
+    """
+    ADXL345 registers. sample_fn() returns the current (x, y, z) in raw
+    counts and motion_fn() whether the sensor sees activity right now.
+
+    Like the real part, the activity bit latches in INT_SOURCE until
+    INT_SOURCE is read. Activity is sampled on every register read and
+    whenever poll_activity() is called.
+    """
+
+    DATAX0 = 0x32
+    INT_SOURCE = 0x30
+    ACTIVITY = 0x10
+
+    def __init__(self):
+        super().__init__(64)
+        self.registers[0x00] = 0xE5  # DEVID
+        self.sample_fn = lambda: (0, 0, 255)
+        self.motion_fn = lambda: False
+        self.int_source = 0
+
+    def poll_activity(self):
+        if self.motion_fn():
+            self.int_source |= self.ACTIVITY
+
+    def read(self, length):
+        self.poll_activity()
+        if self.pointer == self.DATAX0:
+            data = struct.pack("<hhh", *self.sample_fn())
+            return data[:length]
+        if self.pointer == self.INT_SOURCE:
+            value, self.int_source = self.int_source, 0  # reading clears it
+            return bytes((value,))[:length]
+        return super().read(length)
+
+
+class LSM6DSOXModel(RegisterDevice):
+    """
+    LSM6DSOX accelerometer registers. sample_fn() returns the current
+    (x, y, z) in raw counts; fifo holds queued samples for the FIFO.
+    """
+
+    OUTX_L_A = 0x28
+    FIFO_STATUS1 = 0x3A
+    FIFO_DATA_OUT_TAG = 0x78
+
+    def __init__(self):
+        super().__init__(128)
+        self.registers[0x0F] = 0x6C  # WHO_AM_I
+        self.sample_fn = lambda: (0, 0, 16393)
+        self.fifo = []
+
+    def read(self, length):
+        if self.pointer == self.OUTX_L_A:
+            return struct.pack("<hhh", *self.sample_fn())[:length]
+        if self.pointer == self.FIFO_STATUS1:
+            count = len(self.fifo)
+            return bytes((count & 0xFF, count >> 8 & 0x03))[:length]
+        if self.pointer == self.FIFO_DATA_OUT_TAG:
+            tag = 0x02 << 3  # accelerometer
+            return (bytes((tag,)) + struct.pack("<hhh", *self.fifo.pop(0)))[:length]
+        return super().read(length)
+
+
+class SSD1306Model(RegisterDevice):
+    """OLED: accepts commands and pixel data."""
+
+    def write_register(self, register, value):
+        pass
+
+
+def default_devices():
+    return {0x53: ADXL345Model(), 0x6A: LSM6DSOXModel(), 0x3C: SSD1306Model()}
@@ -0,0 +1,7 @@
+"""Simulated i2cdisplaybus."""
+
+
+class I2CDisplayBus:
+    def __init__(self, i2c_bus, *, device_address, reset=None):
+        self.i2c_bus = i2c_bus
+        self.device_address = device_address
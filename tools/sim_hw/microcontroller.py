@@ -0,0 +1,30 @@
+"""
+Simulated CircuitPython microcontroller module. nvm behaves like a
+bytearray (erased flash reads 0xFF) and keeps its contents across main()
+restarts within one process, like NVM across a reset.
+
+If write_hook is set, every nvm write calls write_hook(data, key, value)
+instead; the simulation uses it to cut a write short with a power loss.
+"""
+
+write_hook = None
+
+
+class NVM:
+    def __init__(self, size):
+        self.data = bytearray(b"\xff" * size)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        if write_hook is not None:
+            write_hook(self.data, key, value)
+        else:
+            self.data[key] = value
+
+
+nvm = NVM(8192)
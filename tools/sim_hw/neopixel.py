@@ -0,0 +1,33 @@
+"""Simulated NeoPixel strip."""
+
+
+class NeoPixel:
+    def __init__(self, pin, n, *, brightness=1.0, auto_write=True, **_kwargs):
+        self.pin = pin
+        self.n = n
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self._pixels = [(0, 0, 0)] * n
+        self.shown = list(self._pixels)
+
+    def __setitem__(self, index, color):
+        self._pixels[index] = color
+        if self.auto_write:
+            self.show()
+
+    def __getitem__(self, index):
+        return self._pixels[index]
+
+    def __len__(self):
+        return self.n
+
+    def fill(self, color):
+        self._pixels = [color] * self.n
+        if self.auto_write:
+            self.show()
+
+    def show(self):
+        self.shown = list(self._pixels)
+
+    def deinit(self):
+        pass
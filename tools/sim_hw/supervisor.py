@@ -0,0 +1,8 @@
+"""Simulated CircuitPython supervisor module: ticks_ms() follows the virtual clock."""
+import clock
+
+_TICKS_MAX = (1 << 29) - 1
+
+
+def ticks_ms():
+    return clock.now_ms & _TICKS_MAX
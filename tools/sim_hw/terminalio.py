@@ -0,0 +1,3 @@
+"""Simulated terminalio."""
+
+FONT = object()
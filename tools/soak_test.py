@@ -0,0 +1,653 @@
+"""
+Headless soak test for long-running kiosk stability.
+
+Runs the real src/main.py game loop (welcome -> select_difficulty ->
+calibration -> play_game, over and over) on the simulated hardware in
+tools/sim_hw/, driven by a randomized virtual player. time.sleep() only
+advances a virtual clock, so rounds run much faster than real time.
+
+Per window of rounds it records memory (live objects, display objects,
+allocated heap blocks), the host CPU time of each firmware loop iteration
+(p50/p95/p99), the encoder's raw position and error counts (exceptions and
+stalls), then fails if any of them trends upwards. The harness keeps only
+fixed-size state per window (loop times go into a histogram), so memory
+growth comes from the firmware. With --tracemalloc (several times slower) it
+also tracks the heap allocated from src/, lib/ and tools/sim_hw/ alone.
+
+With --replay-seed, every game uses the level plan of that seed (as printed
+by the game over serial).
+
+With --resets, power is pulled at random moments; the game restarts from
+its NVM checkpoint (fast resume), and every reset during a game must
+resume. With --torn-writes, that fraction of checkpoint writes is cut short
+by a power loss partway through the slot; the next boot must then load the
+checkpoint from before the torn write (the previous level boundary, or the
+game in progress when a clear() was torn).
+
+    python tools/soak_test.py --rounds 100000 --seed 1
+    python tools/soak_test.py --rounds 2000 --resets 0.0005 --torn-writes 0.05
+    python tools/soak_test.py --rounds 200 --replay-seed 12345
+"""
+import argparse
+from array import array
+import gc
+import math
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(__file__)
+# the firmware, its libraries and the simulated CircuitPython modules
+FIRMWARE_DIRS = (os.path.join(HERE, "..", "src"), os.path.join(HERE, "..", "lib"),
+                 os.path.join(HERE, "sim_hw"))
+for path in FIRMWARE_DIRS:
+    sys.path.insert(0, path)  # sim_hw ends up first
+
+# allocations made from code in FIRMWARE_DIRS count as the firmware's heap
+FIRMWARE_FILTERS = [tracemalloc.Filter(True, os.path.join(path, "*")) for path in FIRMWARE_DIRS]
+
+import alarm  # noqa: E402
+import board  # noqa: E402
+import clock  # noqa: E402
+import microcontroller  # noqa: E402
+import checkpoint  # noqa: E402
+import displayio  # noqa: E402
+from adafruit_display_text import label  # noqa: E402
+
+GRAVITY = 9.80665
+STALL_MS = 15 * 60 * 1000  # no screen change for this long is a failure
+MISSED_PRESS_MS = 1000  # a press on a lit screen must change the screen within this
+WAKE_GRACE_MS = 1000  # a wake from DISPLAY_OFF / SLEEP must follow player input this closely
+
+# (axis, sign) of the movement that produces each command
+COMMAND_MOTION = {
+    "FORWARD": (0, 1.0),
+    "BACKWARD": (0, -1.0),
+    "LEFT": (1, 1.0),
+    "RIGHT": (1, -1.0),
+}
+ARROW_COMMAND = {"^": "FORWARD", "v": "BACKWARD", "<": "LEFT", ">": "RIGHT"}
+
+# (A, B) levels for one clockwise encoder cycle (4 edges)
+ENCODER_CYCLE = ((True, False), (False, False), (False, True), (True, True))
+
+
+class SoakDone(Exception):
+    pass
+
+
+class PowerLoss(Exception):
+    pass
+
+
+class Stall(Exception):
+    pass
+
+
+def screen_texts(group):
+    return [layer.text for layer in group if isinstance(layer, label.Label)] if group else []
+
+
+def screen_name(texts):
+    if not texts:
+        return None
+    first = texts[0]
+    if first == "Welcome To":
+        return "welcome"
+    if first == "Select Difficulty":
+        return "menu"
+    if first == "Loading...":
+        return "calibration"
+    if first == "Level Failed":
+        return "fail"
+    if first == "CONGRATULATIONS!":
+        return "win"
+    if len(texts) > 1 and texts[1] == "Are you ready":
+        return "ready"
+    if len(texts) > 1 and texts[1].startswith("Step "):
+        return "command"
+    return "unknown"
+
+
+class VirtualPlayer:
+    """
+    Watches the simulated display and reacts like a player: presses the
+    button, turns the encoder and performs arm movements after a random
+    reaction time. Sometimes hesitates (the device is in SLOW_POLL when the
+    press comes) and occasionally walks away to let the idle manager step down.
+    """
+
+    def __init__(self, game, rng, *, p_correct=0.985, p_wrong=0.01, p_hesitate=0.05,
+                 p_walk_away=0.01):
+        self.game = game
+        self.rng = rng
+        self.p_correct = p_correct
+        self.p_wrong = p_wrong
+        self.p_hesitate = p_hesitate
+        self.p_walk_away = p_walk_away
+
+        self.actions = []       # [(at_ms, fn)] sorted by time
+        self.group = None
+        self.screen = None
+        self.screen_since = clock.now_ms
+        self.replan_at = None
+        self.motion = None      # (axis, sign, peak, start_ms, duration_ms)
+        self.enc_step = 0
+        self.target_difficulty = 0
+
+        board.D9.level = True
+        board.D7.level = board.D8.level = True
+        self.scale = game.accelerometer.scale
+        self.last_input_ms = clock.now_ms
+        self.missed_presses = 0
+        self.adxl345 = adxl345 = game.i2c.devices[0x53]
+        adxl345.sample_fn = self.raw_counts
+        adxl345.motion_fn = self.moving
+        alarm.sleep_hook = self.light_sleep
+
+    # ---- sensor model ----
+    def acceleration(self):
+        rng = self.rng
+        sample = [rng.gauss(0.0, 0.3), rng.gauss(0.0, 0.3), GRAVITY + rng.gauss(0.0, 0.3)]
+        if self.moving():
+            axis, sign, peak, start, duration = self.motion
+            phase = (clock.now_ms - start) / duration
+            # half-sine pulse along the movement axis
+            sample[axis] += sign * peak * math.sin(math.pi * phase)
+        return tuple(sample)
+
+    def raw_counts(self):
+        scale = self.scale
+        return tuple(int(round(v / scale)) for v in self.acceleration())
+
+    def moving(self):
+        if self.motion is None:
+            return False
+        _, _, _, start, duration = self.motion
+        return start <= clock.now_ms < start + duration
+
+    # ---- actions ----
+    def at(self, delay_ms, fn):
+        self.actions.append((clock.now_ms + int(delay_ms), fn))
+        self.actions.sort(key=lambda a: a[0])
+
+    def press(self, delay_ms):
+        hold_ms = self.rng.randint(80, 200)
+        lit = []  # was the screen on at the press (not a wake-only press)?
+
+        def down():
+            board.D9.level = False
+            lit.append(self.game.idle.state < self.game.IdleManager.DISPLAY_OFF)
+
+        def missed():
+            # still scheduled, so the screen has not changed since the press
+            if lit and lit[0]:
+                self.missed_presses += 1
+
+        self.at(delay_ms, down)
+        self.at(delay_ms + hold_ms, lambda: setattr(board.D9, "level", True))
+        self.at(delay_ms + hold_ms + MISSED_PRESS_MS, missed)
+
+    def turn(self, delay_ms, edges):
+        for i in range(edges):
+            self.at(delay_ms + 6 * i, self._encoder_edge)
+
+    def _encoder_edge(self):
+        board.D7.level, board.D8.level = ENCODER_CYCLE[self.enc_step % 4]
+        self.enc_step += 1
+
+    def move(self, delay_ms, axis, sign):
+        peak = self.rng.uniform(10.0, 18.0)
+        duration = self.rng.randint(200, 400)
+        self.at(delay_ms, lambda: setattr(self, "motion",
+                                          (axis, sign, peak, clock.now_ms, duration)))
+
+    def think_ms(self, low=200, high=1500, *, may_hesitate=False):
+        roll = self.rng.random()
+        if roll < self.p_walk_away:
+            return self.rng.randint(20, 400) * 1000
+        if may_hesitate and roll < self.p_walk_away + self.p_hesitate:
+            return self.rng.randint(16, 55) * 1000
+        return self.rng.randint(low, high)
+
+    # ---- decisions ----
+    def plan(self, texts):
+        rng = self.rng
+        screen = self.screen
+        if screen in ("welcome", "ready", "fail", "win"):
+            self.press(self.think_ms(may_hesitate=True))
+        elif screen == "menu":
+            selected = texts.index(">") - 2 if ">" in texts else 0
+            if selected == self.target_difficulty:
+                self.press(self.think_ms(150, 800, may_hesitate=True))
+            else:
+                self.turn(self.think_ms(100, 500), 8)
+        elif screen == "command":
+            command = ARROW_COMMAND[texts[2]]
+            roll = rng.random()
+            if roll < self.p_correct:
+                axis, sign = COMMAND_MOTION[command]
+            elif roll < self.p_correct + self.p_wrong:
+                axis, sign = COMMAND_MOTION[rng.choice(
+                    [c for c in COMMAND_MOTION if c != command])]
+            else:
+                return  # let the command time out
+            self.move(self.think_ms(150, 1200), axis, sign)
+        # retry if the screen has not moved on (missed press, wake-only press, ...)
+        self.replan_at = clock.now_ms + 20000
+
+    def tick(self):
+        group = self.game.display.root_group
+        if group is not self.group:
+            self.group = group
+            texts = screen_texts(group)
+            name = screen_name(texts)
+            if name == "menu" and self.screen != "menu":
+                self.target_difficulty = self.rng.randrange(3)
+            self.screen = name
+            self.screen_since = clock.now_ms
+            self.actions = []
+            self.plan(texts)
+        elif self.replan_at is not None and clock.now_ms >= self.replan_at and not self.actions:
+            self.plan(screen_texts(group))
+
+        while self.actions and self.actions[0][0] <= clock.now_ms:
+            _, fn = self.actions.pop(0)
+            fn()
+            self.last_input_ms = clock.now_ms
+        # the sensor latches activity whether or not the firmware is reading it
+        self.adxl345.poll_activity()
+
+        if clock.now_ms - self.screen_since > STALL_MS and self.screen != "calibration":
+            raise Stall(f"stuck on {self.screen} screen")
+
+    def light_sleep(self, alarms):
+        """Sleep until the next scheduled player action (button or motion) or timer alarm."""
+        if not self.actions:
+            self.plan(screen_texts(self.group))
+        wake_at = self.actions[0][0] if self.actions else clock.now_ms + STALL_MS
+        timer = alarms[-1]
+        if isinstance(timer, alarm.time.TimeAlarm) and timer.wake_ms < wake_at:
+            clock.set_ms(max(clock.now_ms, timer.wake_ms))
+            return timer
+        clock.set_ms(max(clock.now_ms, wake_at))
+        self.tick()
+        return alarms[0]
+
+
+class LoopHistogram:
+    """
+    Loop times (ns) in fixed log-spaced buckets: 16 per octave (about 4 %
+    resolution) from 16 ns to about 18 min, in one preallocated array.
+    """
+
+    SUB_BUCKETS = 16
+    SIZE = 38 * SUB_BUCKETS
+
+    def __init__(self):
+        self.counts = array("q", bytes(8 * self.SIZE))
+        self.total = 0
+
+    def add(self, ns):
+        bits = ns.bit_length()
+        if bits <= 5:
+            index = ns
+        else:
+            # octave from the bit length, sub-bucket from the next 4 bits
+            index = (bits - 5) * self.SUB_BUCKETS + (ns >> (bits - 5))
+        self.counts[min(index, self.SIZE - 1)] += 1
+        self.total += 1
+
+    @classmethod
+    def bucket_mid(cls, index):
+        if index < 2 * cls.SUB_BUCKETS:
+            return float(index)
+        shift = index // cls.SUB_BUCKETS - 1
+        mantissa = index % cls.SUB_BUCKETS + cls.SUB_BUCKETS
+        return (mantissa + 0.5) * (1 << shift)
+
+    def percentile(self, p):
+        if not self.total:
+            return 0.0
+        rank = max(1, int(math.ceil(p / 100.0 * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bucket_mid(index)
+        return self.bucket_mid(self.SIZE - 1)
+
+    def clear(self):
+        for index in range(self.SIZE):
+            self.counts[index] = 0
+        self.total = 0
+
+
+def rise(values):
+    """Least-squares slope times span: how much the series grew over the run."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2.0
+    mean_y = sum(values) / n
+    num = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+    den = sum((i - mean_x) ** 2 for i in range(n))
+    return num / den * (n - 1)
+
+
+# metric: (relative tolerance, absolute tolerance) for the rise over the run
+TREND_LIMITS = {
+    "live_objects": (0.02, 200),
+    "display_objects": (0.10, 20),
+    "heap_blocks": (0.02, 500),
+    "firmware_kb": (0.05, 32),
+    "maxrss_kb": (0.10, 2048),
+    "loop_p50_us": (0.50, 20),
+    "loop_p99_us": (1.00, 100),
+    "encoder_raw_max": (0.50, 48),
+    "errors": (0.0, 0.5),
+}
+# counters that must stay at zero over the whole run
+MUST_BE_ZERO = ("spurious_wakes", "missed_presses")
+
+
+class SoakTest:
+    def __init__(self, *, rounds, seed, windows, use_tracemalloc=False, verbose=False,
+                 resets=0.0, torn_writes=0.0, replay_seed=None):
+        self.rounds = rounds
+        self.reset_rate = resets
+        self.torn_write_rate = torn_writes
+        self.window_rounds = max(1, rounds // windows)
+        self.use_tracemalloc = use_tracemalloc
+        self.rng = random.Random(seed)
+        random.seed(seed)
+
+        self.round = 0
+        self.loops = LoopHistogram()
+        self.errors = 0
+        self.spurious_wakes = 0
+        self.wins = 0
+        self.fails = 0
+        self.encoder_raw_max = 0
+        self.resets = 0
+        self.resets_in_game = 0
+        self.resumes = 0
+        self.torn_writes = 0
+        self.torn_clears = 0
+        self._rebooting = False
+        self.torn_mismatches = 0
+        self._expected_checkpoint = False  # what the next boot must load after a torn write
+        self.history = []
+        self._history_blocks = 0  # heap blocks held by self.history itself
+        self._resume_ns = None
+
+        clock.set_ms(0)
+        self._real_sleep = time.sleep
+        time.sleep = self.sleep
+
+        microcontroller.write_hook = self.nvm_write
+        import main as game  # runs the hardware init against sim_hw
+        self.game = game
+        game.REPLAY_SEED = replay_seed
+        if not verbose:
+            game.print = lambda *args, **kwargs: None  # silence the game's serial output
+        self.player = VirtualPlayer(game, self.rng)
+        self._wrap_game()
+
+    def _wrap_game(self):
+        game = self.game
+        play_game = game.play_game
+        show_fail_screen = game.show_fail_screen
+        show_congrats_screen = game.show_congrats_screen
+        resume_game = game.resume_game
+        on_idle_state_change = game.idle._on_state_change
+
+        def counted_play_game(*args, **kwargs):
+            play_game(*args, **kwargs)
+            self.round += 1
+            if self.round % self.window_rounds == 0:
+                self.end_window()
+            if self.round >= self.rounds:
+                raise SoakDone()
+
+        def counted_fail(*args):
+            self.fails += 1
+            show_fail_screen(*args)
+
+        def counted_win(*args):
+            self.wins += 1
+            show_congrats_screen(*args)
+
+        def counted_resume():
+            if game.checkpoints.load() is not None:
+                self.resumes += 1  # offered on this boot
+            return resume_game()
+
+        def watched_idle_state_change(old, new):
+            # waking up without player input, e.g. on a stale activity interrupt
+            if (old >= game.IdleManager.DISPLAY_OFF > new and not self._rebooting
+                    and clock.now_ms - self.player.last_input_ms > WAKE_GRACE_MS):
+                self.spurious_wakes += 1
+            on_idle_state_change(old, new)
+
+        game.idle._on_state_change = watched_idle_state_change
+        game.play_game = counted_play_game
+        game.resume_game = counted_resume
+        game.show_fail_screen = counted_fail
+        game.show_congrats_screen = counted_win
+
+    def sleep(self, seconds):
+        now_ns = time.perf_counter_ns()
+        if self._resume_ns is not None:
+            self.loops.add(now_ns - self._resume_ns)
+
+        self.player.tick()
+        clock.advance_ms(max(1, int(round(seconds * 1000))))
+        self.player.tick()
+
+        encoder = self.game.encoder
+        raw = abs(encoder.position_raw) if encoder is not None else 0
+        if raw > self.encoder_raw_max:
+            self.encoder_raw_max = raw
+        if self.reset_rate and self.rng.random() < self.reset_rate:
+            raise PowerLoss()
+        self._resume_ns = time.perf_counter_ns()
+
+    @staticmethod
+    def checkpoint_key(checkpoint):
+        if checkpoint is None:
+            return None
+        return (checkpoint.difficulty, checkpoint.level, checkpoint.seed, checkpoint.generation)
+
+    def nvm_write(self, data, key, value):
+        """microcontroller.write_hook: sometimes lose power partway through a write."""
+        if self.torn_write_rate and self.rng.random() < self.torn_write_rate:
+            cut = self.rng.randrange(len(value))
+            data[key.start:key.start + cut] = value[:cut]
+            self.torn_writes += 1
+            # save() has not updated the store yet: it still holds the last good record
+            self._expected_checkpoint = self.checkpoint_key(self.game.checkpoints.load())
+            level = checkpoint.struct.unpack_from(checkpoint._FORMAT, value)[4]
+            if level == 0:
+                # clear(): the interrupted game must still be offered for resume
+                self.torn_clears += 1
+                if self._expected_checkpoint is None:
+                    self.torn_mismatches += 1
+            raise PowerLoss()
+        data[key] = value
+
+    def power_cycle(self):
+        """Reboot: RAM state is lost, NVM is kept; the player lets go of everything."""
+        self.resets += 1
+        if self.game.checkpoints.load() is not None:
+            self.resets_in_game += 1
+        self.game.checkpoints = self.game.CheckpointStore(self.game.microcontroller.nvm)
+        # a reboot starts with the display on and the idle manager ACTIVE
+        self._rebooting = True
+        self.game.idle.activity()
+        self._rebooting = False
+        if self._expected_checkpoint is not False:
+            loaded = self.checkpoint_key(self.game.checkpoints.load())
+            if loaded != self._expected_checkpoint:
+                self.torn_mismatches += 1
+                print(f"torn write: loaded {loaded}, expected {self._expected_checkpoint}",
+                      flush=True)
+            self._expected_checkpoint = False
+        self.game.encoder = None
+        self.game.BOOT_MS = self.game.ticks_ms()
+        self.player.actions = []
+        self.player.motion = None
+        board.D9.level = True
+        self.player.screen_since = clock.now_ms
+        self._resume_ns = None
+
+    def end_window(self):
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        objects = gc.get_objects()
+        display_objects = sum(1 for o in objects
+                              if isinstance(o, (displayio.Group, label.Label)))
+        loops = self.loops
+        row = {
+            "round": self.round,
+            "virtual_h": clock.now_ms / 3600000.0,
+            "live_objects": len(objects),
+            "display_objects": display_objects,
+            "heap_blocks": blocks - self._history_blocks,
+            "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "loop_p50_us": loops.percentile(50) / 1000.0,
+            "loop_p95_us": loops.percentile(95) / 1000.0,
+            "loop_p99_us": loops.percentile(99) / 1000.0,
+            "encoder_raw_max": self.encoder_raw_max,
+            "errors": self.errors,
+            "spurious_wakes": self.spurious_wakes,
+            "missed_presses": self.player.missed_presses,
+            "wins": self.wins,
+            "fails": self.fails,
+        }
+        del objects
+        if self.use_tracemalloc:
+            firmware = tracemalloc.take_snapshot().filter_traces(FIRMWARE_FILTERS)
+            row["firmware_kb"] = sum(stat.size for stat in firmware.statistics("filename")) / 1024.0
+            del firmware
+        self.history.append(row)
+        self.print_row(row)
+
+        self.loops.clear()
+        self.errors = self.wins = self.fails = self.spurious_wakes = 0
+        self.player.missed_presses = 0
+        self.encoder_raw_max = 0
+        gc.collect()
+        self._history_blocks += sys.getallocatedblocks() - blocks
+
+    @staticmethod
+    def print_row(row):
+        memory = f"blocks {row['heap_blocks']:>7}  rss {row['maxrss_kb']:>7} KB  "
+        if "firmware_kb" in row:
+            memory += f"fw {row['firmware_kb']:6.1f} KB  "
+        print(f"round {row['round']:>7}  {row['virtual_h']:8.1f} h  "
+              f"objs {row['live_objects']:>7}  disp {row['display_objects']:>4}  {memory}"
+              f"loop p50/p95/p99 {row['loop_p50_us']:6.1f}/{row['loop_p95_us']:6.1f}/"
+              f"{row['loop_p99_us']:7.1f} us  enc {row['encoder_raw_max']:>4}  "
+              f"err {row['errors']:>3}  wake {row['spurious_wakes']:>3}  "
+              f"miss {row['missed_presses']:>3}  win/fail {row['wins']}/{row['fails']}",
+              flush=True)
+
+    def run(self):
+        if self.use_tracemalloc:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            while True:
+                try:
+                    self.game.main()
+                except SoakDone:
+                    break
+                except PowerLoss:
+                    self.power_cycle()
+                except Exception as exc:  # a crash restarts the game, like a reboot
+                    self.errors += 1
+                    print(f"error at round {self.round}: {exc!r}", flush=True)
+                    self.player.screen_since = clock.now_ms
+        finally:
+            time.sleep = self._real_sleep
+            if self.use_tracemalloc:
+                tracemalloc.stop()
+        elapsed = time.perf_counter() - started
+        speedup = clock.now_ms / 1000.0 / elapsed if elapsed else 0.0
+        print(f"{self.round} rounds, {clock.now_ms / 3600000.0:.1f} virtual hours "
+              f"in {elapsed:.1f} s ({speedup:.0f}x real time)")
+        ok = True
+        if self.reset_rate:
+            # the game in progress at a reset must be offered on the next boot
+            ok = self.resumes == self.resets_in_game
+            print(f"resets {self.resets} ({self.resets_in_game} during a game), "
+                  f"resumed {self.resumes} {'ok' if ok else 'MISSING RESUMES'}")
+        if self.torn_write_rate:
+            # a torn slot must fail its CRC and leave the previous checkpoint in force
+            torn_ok = self.torn_clears > 0 and self.torn_mismatches == 0
+            ok = ok and torn_ok
+            print(f"torn writes {self.torn_writes} ({self.torn_clears} in clear()), "
+                  f"wrong checkpoint after "
+                  f"{self.torn_mismatches} {'ok' if torn_ok else 'FAILED'}")
+        ok = self.check_counts() and ok
+        return self.check_trends() and ok
+
+    def check_counts(self):
+        ok = True
+        for metric in MUST_BE_ZERO:
+            total = sum(row[metric] for row in self.history)
+            ok = ok and total == 0
+            print(f"{metric:>16}: {total:10} {'ok' if total == 0 else 'NOT ZERO'}")
+        return ok
+
+    def check_trends(self):
+        # the first window includes start-up allocations and caches
+        rows = self.history[1:]
+        if len(rows) < 3:
+            print("not enough windows for trend checks (use more rounds)")
+            return True
+        ok = True
+        for metric, (rel_tol, abs_tol) in TREND_LIMITS.items():
+            if metric not in rows[0]:
+                continue
+            values = [row[metric] for row in rows]
+            growth = rise(values)
+            limit = max(abs_tol, rel_tol * abs(sum(values) / len(values)))
+            trending = growth > limit
+            ok = ok and not trending
+            print(f"{metric:>16}: rise {growth:10.1f} (limit {limit:8.1f}) "
+                  f"{'UPWARD TREND' if trending else 'ok'}")
+        return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless soak test of the game loop.")
+    parser.add_argument("--rounds", type=int, default=2000,
+                        help="games to play (default 2000; use 100000+ for a full soak)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the virtual player")
+    parser.add_argument("--windows", type=int, default=20,
+                        help="number of measurement windows")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="also track the heap allocated by the firmware (slower)")
+    parser.add_argument("--verbose", action="store_true", help="show the game's serial output")
+    parser.add_argument("--resets", type=float, default=0.0, metavar="P",
+                        help="probability of a power loss per firmware loop iteration")
+    parser.add_argument("--torn-writes", type=float, default=0.0, metavar="P",
+                        help="probability that a checkpoint write is cut short by a power loss")
+    parser.add_argument("--replay-seed", type=int, metavar="SEED",
+                        help="play every game with the level plan of SEED")
+    args = parser.parse_args(argv)
+
+    soak = SoakTest(rounds=args.rounds, seed=args.seed, windows=args.windows,
+                    use_tracemalloc=args.tracemalloc, verbose=args.verbose,
+                    resets=args.resets, torn_writes=args.torn_writes,
+                    replay_seed=args.replay_seed)
+    return 0 if soak.run() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
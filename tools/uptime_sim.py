@@ -0,0 +1,348 @@
+"""
+Long-uptime timing simulation.
+
+Drives the on-device timing code with a virtual millisecond clock placed
+at uptimes from boot to several weeks, including across the 2**29 ms ticks
+wraparound: lib/debouncer.py and lib/rotary_encoder.py directly, and the
+real calibration countdown, per-command time limit and difficulty menu of
+src/main.py on the simulated hardware in tools/sim_hw/. Every debounce
+window, countdown and time limit must fire on exactly the expected
+millisecond (or loop poll), and the menu must still step after a light
+sleep longer than 2**28 ms, when a timestamp from before the sleep can no
+longer be compared with ticks_diff().
+
+    python tools/uptime_sim.py
+"""
+import os
+import struct
+import sys
+import time
+
+HERE = os.path.dirname(__file__)
+for path in (os.path.join(HERE, "..", "src"), os.path.join(HERE, "..", "lib"),
+             os.path.join(HERE, "sim_hw")):
+    sys.path.insert(0, path)  # sim_hw ends up first
+
+import alarm  # noqa: E402
+import board  # noqa: E402
+import clock  # noqa: E402
+from debouncer import Debouncer  # noqa: E402
+from rotary_encoder import RotaryEncoder  # noqa: E402
+from ticks import _TICKS_PERIOD  # noqa: E402
+
+HOUR_MS = 3600 * 1000
+DAY_MS = 24 * HOUR_MS
+
+# Start points: fresh boot, a working day, just before each ticks wrap, weeks
+UPTIMES_MS = (
+    0,
+    1 * HOUR_MS,
+    12 * HOUR_MS,
+    _TICKS_PERIOD - 20,
+    2 * _TICKS_PERIOD - 3,
+    30 * DAY_MS,
+)
+
+DEBOUNCE_MS = 50
+ENC_DEBOUNCE_MS = 3
+CALIBRATION_MS = 5000
+LEVEL_POLL_MS = 10  # loop delay of play_one_level
+MENU_STEP_INTERVAL_MS = 80
+LONG_SLEEP_MS = 3 * DAY_MS + 12 * HOUR_MS  # > 2**28 ms: ticks_diff() no longer works
+
+
+class Button:
+    """Active-low push button on a simulated pin."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.pin.level = True
+
+    @property
+    def value(self):
+        return self.pin.level
+
+
+def run_until(predicate, limit_ms):
+    """Step the clock 1 ms at a time; return ms elapsed when predicate() is True."""
+    for elapsed in range(limit_ms + 1):
+        if predicate():
+            return elapsed
+        clock.advance_ms(1)
+    return None
+
+
+def check_debounce(uptime_ms):
+    clock.set_ms(uptime_ms)
+    button = Button(board.D9)
+    debouncer = Debouncer(button, debounce_ms=DEBOUNCE_MS)
+    errors = []
+
+    for press in range(3):
+        # Contact chatter: toggle every 5 ms for 30 ms, then settle pressed
+        for _ in range(6):
+            button.pin.level = not button.pin.level
+            if debouncer.fell():
+                errors.append(f"press {press}: fired during chatter")
+            clock.advance_ms(5)
+        button.pin.level = False
+        fired_after = run_until(debouncer.fell, 2 * DEBOUNCE_MS)
+        # Accepted on the first poll strictly after the debounce window
+        if fired_after != DEBOUNCE_MS + 1:
+            errors.append(f"press {press}: fell after {fired_after} ms, "
+                          f"expected {DEBOUNCE_MS + 1}")
+        if run_until(debouncer.fell, 3 * DEBOUNCE_MS) is not None:
+            errors.append(f"press {press}: fell twice")
+
+        button.pin.level = True
+
+        def released():
+            debouncer.fell()
+            return debouncer.value
+
+        if run_until(released, 2 * DEBOUNCE_MS) != DEBOUNCE_MS + 1:
+            errors.append(f"press {press}: release not debounced")
+        clock.advance_ms(1000)
+    return errors
+
+
+# Gray code sequence of (A, B) pin levels while turning the knob
+GRAY_STEPS = ((False, True), (False, False), (True, False), (True, True))
+
+
+def check_encoder(uptime_ms):
+    """Every edge must be accepted exactly debounce_ms after it appeared."""
+    clock.set_ms(uptime_ms)
+    pin_a, pin_b = board.D7, board.D8
+    pin_a.level = pin_b.level = True
+    encoder = RotaryEncoder(pin_a, pin_b, debounce_ms=ENC_DEBOUNCE_MS,
+                            pulses_per_detent=3)
+    errors = []
+
+    for step in range(12):
+        before = encoder.position_raw
+        pin_a.level, pin_b.level = GRAY_STEPS[step % 4]
+
+        def edge_accepted():
+            encoder.update()
+            return encoder.position_raw != before
+
+        accepted_after = run_until(edge_accepted, 4 * ENC_DEBOUNCE_MS)
+        if accepted_after != ENC_DEBOUNCE_MS:
+            errors.append(f"edge {step}: accepted after {accepted_after} ms, "
+                          f"expected {ENC_DEBOUNCE_MS}")
+        clock.advance_ms(20)
+    return errors
+
+
+class SimTimeout(Exception):
+    pass
+
+
+class Script:
+    """
+    Player actions at virtual times for the firmware running on sim_hw.
+    time.sleep() only advances the virtual clock; before and after each
+    sleep the due actions run, and watch() sees the screen once per poll.
+    """
+
+    def __init__(self):
+        self.actions = []
+        self.watch = None
+        self.deadline_ms = None
+        self.enc_step = 0
+
+    def reset(self, deadline_ms, watch=None):
+        self.actions = []
+        self.watch = watch
+        self.deadline_ms = deadline_ms
+
+    def at(self, at_ms, fn):
+        self.actions.append((at_ms, fn))
+        self.actions.sort(key=lambda a: a[0])
+
+    def press(self, at_ms, hold_ms=100):
+        self.at(at_ms, lambda: setattr(board.D9, "level", False))
+        self.at(at_ms + hold_ms, lambda: setattr(board.D9, "level", True))
+
+    def turn(self, at_ms, edges=8):
+        for i in range(edges):
+            self.at(at_ms + 6 * i, self._encoder_edge)
+
+    def _encoder_edge(self):
+        board.D7.level, board.D8.level = GRAY_STEPS[self.enc_step % 4]
+        self.enc_step += 1
+
+    def run_due(self):
+        while self.actions and self.actions[0][0] <= clock.now_ms:
+            _, fn = self.actions.pop(0)
+            fn()
+
+    def sleep(self, seconds):
+        if self.watch:
+            self.watch()
+        self.run_due()
+        clock.advance_ms(max(1, int(round(seconds * 1000))))
+        self.run_due()
+        if self.deadline_ms is not None and clock.now_ms > self.deadline_ms:
+            raise SimTimeout()
+
+
+script = Script()
+time.sleep = script.sleep
+import main as game  # noqa: E402  (runs the hardware init against sim_hw)
+game.print = lambda *args, **kwargs: None  # silence the game's serial output
+
+
+def screen_texts():
+    group = game.display.root_group
+    return [layer.text for layer in group if hasattr(layer, "text")] if group else []
+
+
+def check_calibration(uptime_ms):
+    """show_calibration_screen_and_calibrate(): 5 s, counting down 5..1."""
+    clock.set_ms(uptime_ms)
+    shown = []
+
+    def watch():
+        texts = screen_texts()
+        if len(texts) > 2 and (not shown or shown[-1] != texts[2]):
+            shown.append(texts[2])
+
+    script.reset(uptime_ms + 2 * CALIBRATION_MS, watch)
+    errors = []
+    try:
+        game.show_calibration_screen_and_calibrate()
+    except SimTimeout:
+        return [f"calibration: still running after {2 * CALIBRATION_MS} ms"]
+    took_ms = clock.now_ms - uptime_ms
+    if took_ms != CALIBRATION_MS:
+        errors.append(f"calibration: took {took_ms} ms, expected {CALIBRATION_MS}")
+    if shown != ["5", "4", "3", "2", "1"]:
+        errors.append(f"calibration: countdown showed {shown}")
+    return errors
+
+
+def check_time_limits(uptime_ms):
+    """play_one_level() without movement: fail on the first poll after the time limit."""
+    errors = []
+    for difficulty in ("EASY", "MEDIUM", "HARD"):
+        limit_ms = game.get_time_limit_ms(difficulty)
+        clock.set_ms(uptime_ms)
+        seconds_shown = set()
+
+        def watch():
+            for text in screen_texts():
+                if text.startswith("Time: "):
+                    seconds_shown.add(int(text[6:-1]))
+
+        script.reset(uptime_ms + 2 * limit_ms, watch)
+        try:
+            passed = game.play_one_level(difficulty, 1, ["LEFT"], ready_shown=True)
+        except SimTimeout:
+            errors.append(f"{difficulty}: no time out after {2 * limit_ms} ms")
+            continue
+        fired_after = clock.now_ms - uptime_ms
+        expected = (limit_ms // LEVEL_POLL_MS + 1) * LEVEL_POLL_MS
+        if passed or fired_after != expected:
+            errors.append(f"{difficulty}: {'passed' if passed else 'failed'} after "
+                          f"{fired_after} ms, expected a time out after {expected} ms")
+        if seconds_shown != set(range(limit_ms // 1000 + 1)):
+            errors.append(f"{difficulty}: countdown showed {sorted(seconds_shown)}")
+    return errors
+
+
+def check_menu(uptime_ms):
+    """
+    select_difficulty(): one turn steps EASY -> MEDIUM, then the menu idles
+    into light sleep for LONG_SLEEP_MS (woken by the hourly timer alarm in
+    between). After the wake a turn must step to HARD at once and a press
+    must select it, and the idle manager must count the sleep as SLEEP time.
+    """
+    clock.set_ms(uptime_ms)
+    board.D7.level = board.D8.level = True
+    board.D9.level = True
+    steps = []  # (ms, entry) of every menu step
+    selected = []
+    turned_at = []
+    asleep_since = []
+
+    def watch():
+        texts = screen_texts()
+        if texts and texts[0] == "Select Difficulty" and ">" in texts:
+            entry = texts[texts.index(">") - 1]
+            if selected and selected[-1] != entry:
+                steps.append((clock.now_ms, entry))
+            selected.append(entry)
+
+    def light_sleep(alarms):
+        if not asleep_since:
+            asleep_since.append(clock.now_ms)
+        timer = alarms[-1]
+        if timer.wake_ms < asleep_since[0] + LONG_SLEEP_MS:
+            clock.set_ms(timer.wake_ms)
+            return timer
+        clock.set_ms(asleep_since[0] + LONG_SLEEP_MS)
+        turned_at.append(clock.now_ms + 500)
+        script.turn(turned_at[-1])
+        script.press(clock.now_ms + 1500)
+        return alarms[1]  # woken by motion
+
+    script.reset(uptime_ms + LONG_SLEEP_MS + 2 * game.IDLE_SLEEP_AFTER_MS, watch)
+    script.turn(uptime_ms + 500)
+    alarm.sleep_hook = light_sleep
+    slept_before_ms = game.idle.time_in_state_ms()["SLEEP"]
+    try:
+        chosen = game.select_difficulty()
+    except SimTimeout:
+        chosen = None
+    finally:
+        alarm.sleep_hook = None
+
+    errors = []
+    if not turned_at:
+        errors.append("menu: never entered light sleep")
+    if chosen != "HARD":
+        errors.append(f"menu: selected {chosen}, expected HARD (steps {steps})")
+    elif [entry for _, entry in steps] != ["MEDIUM", "HARD"]:
+        errors.append(f"menu: stepped {steps}, expected MEDIUM then HARD")
+    elif steps[1][0] - turned_at[0] > MENU_STEP_INTERVAL_MS:
+        errors.append(f"menu: step after the sleep took {steps[1][0] - turned_at[0]} ms")
+    slept_ms = game.idle.time_in_state_ms()["SLEEP"] - slept_before_ms
+    # plus one short poll after every hourly timer wake
+    if not LONG_SLEEP_MS <= slept_ms < LONG_SLEEP_MS + 1000:
+        errors.append(f"menu: idle manager counted {slept_ms} ms of SLEEP, "
+                      f"expected {LONG_SLEEP_MS}")
+    return errors
+
+
+def float_monotonic_resolution_ms(uptime_ms):
+    """
+    Resolution of time.monotonic() on CircuitPython at this uptime: a
+    single-precision float stored with the 2 low mantissa bits dropped.
+    """
+    seconds = uptime_ms / 1000.0
+    (bits,) = struct.unpack("<I", struct.pack("<f", seconds))
+    exponent = ((bits >> 23) & 0xFF) - 127
+    return 2.0 ** (exponent - 23 + 2) * 1000.0
+
+
+def main():
+    failures = 0
+    for uptime_ms in UPTIMES_MS:
+        errors = (check_debounce(uptime_ms) + check_encoder(uptime_ms)
+                  + check_calibration(uptime_ms) + check_time_limits(uptime_ms)
+                  + check_menu(uptime_ms))
+        hours = uptime_ms / HOUR_MS
+        resolution = float_monotonic_resolution_ms(max(uptime_ms, 1))
+        status = "OK" if not errors else "FAIL"
+        print(f"uptime {hours:8.2f} h: {status} "
+              f"(float monotonic() would resolve only {resolution:.3g} ms)")
+        for error in errors:
+            print(f"    {error}")
+        failures += len(errors)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())